@@ -1,15 +1,86 @@
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Charts are only written to disk, also inside worker processes
 import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
+from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+import argparse
 import os
+import re
+
+# PNG encoding dominates save time on these large canvases; trade a little
+# file size for a much cheaper zlib pass
+PNG_PIL_KWARGS = {'optimize': False, 'compress_level': 1}
+DEFAULT_DPI = 150
+
+# Bar label format for each known metric; sub-second timings get extra precision
+METRIC_FORMATS = {
+    "Buffer Length (ms)": '{:.1f}ms',
+    "Buffer Underruns": '{:.2f}',
+    "Delay (seconds)": '{:.4f}s',
+    "Delivery Efficiency (%)": '{:.1f}%',
+    "Estimated MOS (1-5)": '{:.2f}',
+    "Jitter (seconds)": '{:.4f}s',
+    "Loss (%)": '{:.1f}%',
+    "Path Utilization Ratio (%)": '{:.1f}%',
+    "Throughput (Mbps)": '{:.1f}',
+    "Throughput Stability (stddev)": '{:.2f}',
+}
+
+# Only these columns are used downstream; declaring them up front skips type inference
+CSV_COLUMNS = {
+    'Metric': 'category',
+    'Scenario': 'category',
+    'Multipath-NADA': 'float64',
+    'Aggregated-NADA': 'float64',
+    'Improvement (%)': 'float64',
+}
+
+def _format_labels(values, format_str):
+    """Format a whole array of bar values at once, leaving NaN bars unlabelled"""
+    formatted = np.vectorize(format_str.format, otypes=[object])(values)
+    return np.where(np.isnan(values), '', formatted)
+
+def _chart_file_prefix(metric):
+    """Return the timestamp-less file name prefix of a metric's enhanced chart"""
+    safe_metric_name = metric.replace(' ', '_').replace('(', '').replace(')', '').replace('%', 'pct').replace('/', '_')
+    return f"enhanced_{safe_metric_name}_"
+
+def _png_dpi(path):
+    """Return the resolution stored in a PNG's header, or None if it has none"""
+    with Image.open(path) as image:
+        dpi = image.info.get('dpi')
+    # pHYs stores pixels per metre, so the value read back is only close to the saved dpi
+    return round(dpi[0]) if dpi else None
+
+def _find_fresh_output(output_dir, prefix, source_mtime, dpi):
+    """Return the newest '<prefix><timestamp>.png' in output_dir if it is newer than the source data
+    and was rendered at the requested dpi"""
+    pattern = re.compile(re.escape(prefix) + r"\d{8}_\d{6}\.png")
+    candidates = [path for path in Path(output_dir).glob(f"{prefix}*.png") if pattern.fullmatch(path.name)]
+    if not candidates:
+        return None
+    newest = max(candidates, key=lambda path: path.stat().st_mtime)
+    if newest.stat().st_mtime < source_mtime or _png_dpi(newest) != dpi:
+        return None
+    return newest
 
-def create_enhanced_metric_chart(df, metric, output_dir, timestamp):
-    """Create an enhanced chart for a specific metric"""
+@lru_cache(maxsize=1)
+def _enhanced_chart_canvas():
+    """Return the Figure/Axes pair reused by every enhanced chart in this process"""
+    fig, ax = plt.subplots(figsize=(32, 14))  # Increased width to accommodate larger spacing
+    # Let the layout engine fit the rotated labels at draw time, so savefig
+    # needs only a single render pass instead of bbox_inches='tight'
+    fig.set_layout_engine('tight', pad=3.0)
+    return fig, ax
 
-    # Filter data for the specific metric
-    metric_data = df[df['Metric'] == metric].copy()
+def create_enhanced_metric_chart(metric_data, metric, output_dir, timestamp, dpi=DEFAULT_DPI,
+                                 fig=None, ax=None):
+    """Create an enhanced chart for a specific metric"""
 
     if metric_data.empty:
         print(f"❌ No data found for metric: {metric}")
@@ -18,8 +89,15 @@ def create_enhanced_metric_chart(df, metric, output_dir, timestamp):
     # Sort scenarios by Multipath-NADA value for better visualization
     metric_data = metric_data.sort_values('Multipath-NADA', ascending=True)
 
-    # Create the plot with enhanced styling
-    fig, ax = plt.subplots(figsize=(32, 14))  # Increased width to accommodate larger spacing
+    # Pull the plotted columns out as ndarrays once instead of indexing pandas per bar
+    mp = metric_data['Multipath-NADA'].to_numpy()
+    agg_arr = metric_data['Aggregated-NADA'].to_numpy()
+    imp = metric_data['Improvement (%)'].to_numpy()
+
+    # Draw onto a reused canvas instead of building a new figure per metric
+    if ax is None:
+        fig, ax = _enhanced_chart_canvas()
+    ax.clear()
 
     scenarios = metric_data['Scenario']
     x = np.arange(len(scenarios))
@@ -38,10 +116,10 @@ def create_enhanced_metric_chart(df, metric, output_dir, timestamp):
         colors = ['#2E86AB', '#F77F00']  # Blue for multipath, orange for aggregated
 
     # Create bars with enhanced styling
-    bars1 = ax.bar(x_scaled - bar_spacing/2, metric_data['Multipath-NADA'], width,
+    bars1 = ax.bar(x_scaled - bar_spacing/2, mp, width,
                   label='Multipath-NADA', color=colors[0], alpha=0.8,
                   edgecolor='black', linewidth=1)
-    bars2 = ax.bar(x_scaled + bar_spacing/2, metric_data['Aggregated-NADA'], width,
+    bars2 = ax.bar(x_scaled + bar_spacing/2, agg_arr, width,
                   label='Aggregated-NADA', color=colors[1], alpha=0.8,
                   edgecolor='black', linewidth=1)
 
@@ -66,146 +144,111 @@ def create_enhanced_metric_chart(df, metric, output_dir, timestamp):
     ax.grid(axis='y', alpha=0.3, linestyle='--', linewidth=0.8)
     ax.set_axisbelow(True)
 
-    # Add value labels on bars with better formatting
-    def add_enhanced_value_labels(bars, values, format_str):
-        for bar, val in zip(bars, values):
-            if not np.isnan(val):
-                height = bar.get_height()
-                # Position labels slightly above bars
-                label_y = height + (ax.get_ylim()[1] - ax.get_ylim()[0]) * 0.01
-
-                ax.annotate(format_str.format(val),
-                           xy=(bar.get_x() + bar.get_width() / 2, label_y),
-                           xytext=(0, 5),  # Increased offset
-                           textcoords="offset points",
-                           ha='center', va='bottom',
-                           fontsize=9, fontweight='bold',  # Slightly larger font
-                           bbox=dict(boxstyle='round,pad=0.1',  # Increased padding
-                                   facecolor='white',
-                                   edgecolor='gray',
-                                   alpha=0.9))
-
     # Format labels based on metric type
-    if 'MOS' in metric:
-        format_str = '{:.2f}'
-    elif '%' in metric:
-        format_str = '{:.1f}%'
-    elif 'seconds' in metric:
-        if metric_data['Multipath-NADA'].max() < 1:
-            format_str = '{:.4f}s'
-        else:
-            format_str = '{:.2f}s'
-    elif 'ms' in metric:
-        format_str = '{:.1f}ms'
-    elif 'Mbps' in metric:
-        format_str = '{:.1f}'
-    else:
-        format_str = '{:.2f}'
-
-    add_enhanced_value_labels(bars1, metric_data['Multipath-NADA'], format_str)
-    add_enhanced_value_labels(bars2, metric_data['Aggregated-NADA'], format_str)
+    format_str = METRIC_FORMATS.get(metric, '{:.2f}')
+    # Check all-NaN first: nanmax warns on it, and such a metric keeps the '.2f' format
+    if 'seconds' in metric and (np.isnan(mp).all() or np.nanmax(mp) >= 1):
+        format_str = '{:.2f}s'
+
+    # Add value labels on bars with better formatting, one bar_label call per series
+    label_style = dict(padding=5, fontsize=9, fontweight='bold',
+                       bbox=dict(boxstyle='round,pad=0.1', facecolor='white',
+                                 edgecolor='gray', alpha=0.9))
+    ax.bar_label(bars1, labels=_format_labels(mp, format_str), **label_style)
+    ax.bar_label(bars2, labels=_format_labels(agg_arr, format_str), **label_style)
+
+    # Axis limits are fixed by the bars at this point, so read them once
+    y_min, y_max = ax.get_ylim()
+    y_range = y_max - y_min
 
-    # Add improvement indicators with better positioning
-    for i, (x_pos, improvement) in enumerate(zip(x_scaled, metric_data['Improvement (%)'])):
-        if not np.isnan(improvement):
-            # Position improvement text between the bars
-            y_max = max(metric_data['Multipath-NADA'].iloc[i], metric_data['Aggregated-NADA'].iloc[i])
-            y_pos = y_max + (ax.get_ylim()[1] - ax.get_ylim()[0]) * 0.08  # Increased offset
+    # Position improvement text above the taller bar of each pair
+    indicator_y = np.fmax(mp, agg_arr) + y_range * 0.08  # Increased offset
 
-            color = 'green' if improvement > 0 else 'red'
-            symbol = '↑' if improvement > 0 else '↓'
+    # Add improvement indicators with better positioning, skipping NaN improvements
+    for i in np.flatnonzero(~np.isnan(imp)):
+        improvement = imp[i]
+        color = 'green' if improvement > 0 else 'red'
+        symbol = '↑' if improvement > 0 else '↓'
 
-            ax.text(x_pos, y_pos, f'{symbol} {improvement:.1f}%',
-                   ha='center', va='bottom', fontsize=8, fontweight='bold',
-                   color=color,
-                   bbox=dict(boxstyle='round,pad=0.2', facecolor=color, alpha=0.2))
+        ax.text(x_scaled[i], indicator_y[i], f'{symbol} {improvement:.1f}%',
+               ha='center', va='bottom', fontsize=8, fontweight='bold',
+               color=color,
+               bbox=dict(boxstyle='round,pad=0.2', facecolor=color, alpha=0.2))
 
     # Adjust y-axis to accommodate labels
-    y_min, y_max = ax.get_ylim()
-    y_range = y_max - y_min
     ax.set_ylim(y_min, y_max + 0.20 * y_range)  # Increased from 0.15 to 0.20
 
-    # Enhanced layout with more padding
-    plt.tight_layout(pad=3.0)
-
     # Save with high quality
-    safe_metric_name = metric.replace(' ', '_').replace('(', '').replace(')', '').replace('%', 'pct').replace('/', '_')
-    save_path = f"{output_dir}/enhanced_{safe_metric_name}_{timestamp}.png"
-    plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    save_path = Path(output_dir) / f"{_chart_file_prefix(metric)}{timestamp}.png"
+    fig.savefig(save_path, dpi=dpi, facecolor='white', pil_kwargs=PNG_PIL_KWARGS)
 
     print(f"✅ Generated enhanced chart for {metric}: {save_path}")
     return save_path
 
-def create_metric_summary_dashboard(df, output_dir, timestamp):
-    """Create a comprehensive dashboard showing all metrics"""
-
-    # Get all unique metrics
-    metrics = df['Metric'].unique()
+def _chart_worker(task):
+    """Unpack a chart task for ProcessPoolExecutor.map"""
+    return create_enhanced_metric_chart(*task)
 
-    # Create a large dashboard figure
-    fig = plt.figure(figsize=(50, 28))  # Increased size for better spacing
+def create_metric_summary_dashboard(metric_means, output_dir, timestamp, dpi=DEFAULT_DPI):
+    """Create a comprehensive dashboard showing all metrics"""
 
     # Calculate grid layout
-    n_metrics = len(metrics)
+    n_metrics = len(metric_means)
     cols = 4
     rows = (n_metrics + cols - 1) // cols
 
+    # Create a large dashboard figure with the whole subplot grid up front
+    fig, axes = plt.subplots(rows, cols, figsize=(50, 28), squeeze=False)  # Increased size for better spacing
+
     fig.suptitle('Comprehensive Network Performance Metrics Dashboard\nMultipath-NADA vs Aggregated-NADA Comparison',
                 fontsize=26, fontweight='bold', y=0.98)
 
-    for idx, metric in enumerate(metrics):
-        ax = plt.subplot(rows, cols, idx + 1)
-
-        # Get data for this metric
-        metric_data = df[df['Metric'] == metric]
-
-        if not metric_data.empty:
-            # Calculate average values
-            mp_avg = metric_data['Multipath-NADA'].mean()
-            agg_avg = metric_data['Aggregated-NADA'].mean()
-
-            # Create simple bar chart for dashboard with more spacing
-            x_pos = [0, 2]  # Increased spacing between bars
-            bars = ax.bar(x_pos, [mp_avg, agg_avg],
-                         width=1.5,  # Slightly wider bars
-                         color=['#2E86AB', '#F77F00'], alpha=0.8)
-
-            ax.set_title(metric, fontsize=10, fontweight='bold', pad=15)
-            ax.grid(axis='y', alpha=0.3)
-            ax.set_xticks(x_pos)
-            ax.set_xticklabels(['Multipath-NADA', 'Aggregated-NADA'], fontsize=11)
-
-            # Add value labels
-            for bar in bars:
-                height = bar.get_height()
-                if not np.isnan(height):
-                    if 'seconds' in metric and height < 1:
-                        label = f'{height:.4f}'
-                    elif '%' in metric:
-                        label = f'{height:.1f}%'
-                    else:
-                        label = f'{height:.2f}'
-
-                    ax.text(bar.get_x() + bar.get_width()/2., height + height*0.02,
-                           label, ha='center', va='bottom', fontsize=10, fontweight='bold')
-
-            # Calculate and show improvement
-            improvement = ((mp_avg - agg_avg) / agg_avg * 100) if agg_avg != 0 else 0
-            if not np.isnan(improvement):
-                color = 'green' if improvement > 0 else 'red'
-                ax.text(0.5, 0.95, f'Δ {improvement:.1f}%', transform=ax.transAxes,
-                       ha='center', va='top', fontsize=10, fontweight='bold', color=color)
+    for ax, metric, (mp_avg, agg_avg) in zip(axes.flat, metric_means.index, metric_means.to_numpy()):
+        # Create simple bar chart for dashboard with more spacing
+        x_pos = [0, 2]  # Increased spacing between bars
+        bars = ax.bar(x_pos, [mp_avg, agg_avg],
+                     width=1.5,  # Slightly wider bars
+                     color=['#2E86AB', '#F77F00'], alpha=0.8)
+
+        ax.set_title(metric, fontsize=10, fontweight='bold', pad=15)
+        ax.grid(axis='y', alpha=0.3)
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(['Multipath-NADA', 'Aggregated-NADA'], fontsize=11)
+
+        # Add value labels
+        heights = np.array([mp_avg, agg_avg])
+        for i in np.flatnonzero(~np.isnan(heights)):
+            bar, height = bars[i], heights[i]
+            if 'seconds' in metric and height < 1:
+                label = f'{height:.4f}'
+            elif '%' in metric:
+                label = f'{height:.1f}%'
+            else:
+                label = f'{height:.2f}'
+
+            ax.text(bar.get_x() + bar.get_width()/2., height + height*0.02,
+                   label, ha='center', va='bottom', fontsize=10, fontweight='bold')
+
+        # Calculate and show improvement
+        improvement = ((mp_avg - agg_avg) / agg_avg * 100) if agg_avg != 0 else 0
+        if not np.isnan(improvement):
+            color = 'green' if improvement > 0 else 'red'
+            ax.text(0.5, 0.95, f'Δ {improvement:.1f}%', transform=ax.transAxes,
+                   ha='center', va='top', fontsize=10, fontweight='bold', color=color)
 
         ax.tick_params(axis='x', labelsize=10)
         ax.tick_params(axis='y', labelsize=10)
 
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95], pad=2.0)  # Increased padding
+    # Hide grid cells left over in the last row
+    for ax in axes.flat[n_metrics:]:
+        ax.set_visible(False)
+
+    fig.set_layout_engine('tight', rect=[0, 0.03, 1, 0.95], pad=2.0)  # Increased padding
 
     # Save dashboard
-    dashboard_path = f"{output_dir}/metrics_dashboard_{timestamp}.png"
-    plt.savefig(dashboard_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    dashboard_path = Path(output_dir) / f"metrics_dashboard_{timestamp}.png"
+    fig.savefig(dashboard_path, dpi=dpi, facecolor='white', pil_kwargs=PNG_PIL_KWARGS)
+    plt.close(fig)
 
     print(f"✅ Generated metrics dashboard: {dashboard_path}")
     return dashboard_path
@@ -213,19 +256,33 @@ def create_metric_summary_dashboard(df, output_dir, timestamp):
 def main():
     """Generate enhanced charts for all specified metrics"""
 
+    parser = argparse.ArgumentParser(description="Generate enhanced metric comparison charts")
+    parser.add_argument('--dpi', type=int, default=DEFAULT_DPI,
+                        help=f'Resolution of the saved PNGs (default: {DEFAULT_DPI}, use 300 for print quality)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Number of processes rendering charts in parallel (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-render charts even if they are newer than the CSV')
+    args = parser.parse_args()
+
     # Load the data
     csv_path = "/Users/dani/Desktop/Coding/uni/ns-allinone-3.44/ns-3.44/results/comparison/all_scenarios_summary_20250611_155827.csv"
 
     try:
-        df = pd.read_csv(csv_path)
+        read_kwargs = dict(usecols=list(CSV_COLUMNS), dtype=CSV_COLUMNS)
+        try:
+            df = pd.read_csv(csv_path, engine='pyarrow', **read_kwargs)
+        except ImportError:
+            # pyarrow is optional, fall back to the default C parser
+            df = pd.read_csv(csv_path, **read_kwargs)
         print(f"✅ Successfully loaded CSV with {len(df)} rows")
     except Exception as e:
         print(f"❌ Error loading CSV: {e}")
         return
 
     # Create output directory
-    output_dir = "/Users/dani/Desktop/Coding/uni/ns-allinone-3.44/ns-3.44/results/enhanced_metrics_charts"
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir = Path("/Users/dani/Desktop/Coding/uni/ns-allinone-3.44/ns-3.44/results/enhanced_metrics_charts")
+    output_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # Specified metrics to generate charts for
@@ -245,68 +302,107 @@ def main():
     print(f"\n🎨 Generating enhanced charts for {len(target_metrics)} metrics...")
     print(f"📁 Output directory: {output_dir}")
 
-    generated_charts = []
+    # Partition the data by metric once instead of re-filtering per metric
+    metric_groups = {metric: group for metric, group in df.groupby('Metric', sort=False, observed=True)}
+
+    # Dashboard averages for every metric in a single grouped reduction
+    metric_means = df.groupby('Metric', sort=False, observed=True)[['Multipath-NADA', 'Aggregated-NADA']].mean()
+
+    # Charts already rendered from the current CSV at the same dpi are reused instead of redrawn
+    csv_mtime = os.path.getmtime(csv_path)
 
-    # Generate enhanced charts for each metric
+    # Charts share no state, so render them in separate processes
+    chart_paths = {}
+    reused_metrics = set()
+    tasks = []
     for i, metric in enumerate(target_metrics, 1):
-        print(f"\n[{i}/{len(target_metrics)}] Processing: {metric}")
+        print(f"\n[{i}/{len(target_metrics)}] Queueing: {metric}")
 
-        if metric in df['Metric'].values:
-            chart_path = create_enhanced_metric_chart(df, metric, output_dir, timestamp)
-            if chart_path:
-                generated_charts.append(chart_path)
-        else:
+        if metric not in metric_groups:
             print(f"⚠️  Metric '{metric}' not found in data")
-            print(f"Available metrics: {sorted(df['Metric'].unique())}")
+            print(f"Available metrics: {sorted(metric_groups)}")
+            continue
+
+        existing_chart = None if args.force else _find_fresh_output(output_dir, _chart_file_prefix(metric), csv_mtime, args.dpi)
+        if existing_chart:
+            print(f"♻️  Chart is up to date, reusing: {existing_chart}")
+            chart_paths[metric] = existing_chart
+            reused_metrics.add(metric)
+        else:
+            tasks.append((metric_groups[metric], metric, output_dir, timestamp, args.dpi))
+
+    dashboard_path = None if args.force else _find_fresh_output(output_dir, "metrics_dashboard_", csv_mtime, args.dpi)
+    dashboard_reused = dashboard_path is not None
+
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        # Generate comprehensive dashboard alongside the per-metric charts
+        if dashboard_path:
+            print(f"\n♻️  Dashboard is up to date, reusing: {dashboard_path}")
+        else:
+            print(f"\n📊 Creating comprehensive metrics dashboard...")
+            dashboard_future = executor.submit(create_metric_summary_dashboard,
+                                               metric_means, output_dir, timestamp, args.dpi)
 
-    # Generate comprehensive dashboard
-    print(f"\n📊 Creating comprehensive metrics dashboard...")
-    dashboard_path = create_metric_summary_dashboard(df, output_dir, timestamp)
+        # Generate enhanced charts for each metric
+        for task, path in zip(tasks, executor.map(_chart_worker, tasks)):
+            chart_paths[task[1]] = path
+
+        if not dashboard_path:
+            dashboard_path = dashboard_future.result()
+
+    generated_charts = [chart_paths[metric] for metric in target_metrics
+                        if chart_paths.get(metric) and metric not in reused_metrics]
+    reused_charts = [chart_paths[metric] for metric in target_metrics if metric in reused_metrics]
 
     # Generate summary report
     print(f"\n📋 Generating summary report...")
 
-    summary_stats = {}
-    for metric in target_metrics:
-        if metric in df['Metric'].values:
-            metric_data = df[df['Metric'] == metric]
-            avg_improvement = metric_data['Improvement (%)'].mean()
-            max_improvement = metric_data['Improvement (%)'].max()
-            min_improvement = metric_data['Improvement (%)'].min()
-
-            summary_stats[metric] = {
-                'avg_improvement': avg_improvement,
-                'max_improvement': max_improvement,
-                'min_improvement': min_improvement,
-                'scenarios_count': len(metric_data)
-            }
+    # Reduce the improvement column for every metric in a single grouped pass
+    stats_df = df.groupby('Metric', sort=False, observed=True)['Improvement (%)'].agg(
+        avg_improvement='mean',
+        max_improvement='max',
+        min_improvement='min',
+        scenarios_count='size'
+    )
+    stats_df = stats_df.loc[[metric for metric in target_metrics if metric in stats_df.index]]
+    summary_stats = stats_df.to_dict(orient='index')
 
     # Save summary report
-    report_path = f"{output_dir}/metrics_summary_report_{timestamp}.txt"
-    with open(report_path, 'w') as f:
-        f.write("ENHANCED METRICS ANALYSIS REPORT\n")
-        f.write("=" * 50 + "\n\n")
-        f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Total charts generated: {len(generated_charts)}\n")
-        f.write(f"Dashboard generated: {dashboard_path}\n\n")
-
-        f.write("METRIC IMPROVEMENT SUMMARY:\n")
-        f.write("-" * 30 + "\n")
-
-        for metric, stats in summary_stats.items():
-            f.write(f"\n{metric}:\n")
-            f.write(f"  Average Improvement: {stats['avg_improvement']:.2f}%\n")
-            f.write(f"  Best Case: {stats['max_improvement']:.2f}%\n")
-            f.write(f"  Worst Case: {stats['min_improvement']:.2f}%\n")
-            f.write(f"  Scenarios Tested: {stats['scenarios_count']}\n")
-
-        f.write(f"\nGENERATED CHARTS:\n")
-        f.write("-" * 15 + "\n")
-        for chart in generated_charts:
-            f.write(f"  {os.path.basename(chart)}\n")
-
-    print(f"\n✅ COMPLETE! Generated {len(generated_charts)} enhanced charts")
-    print(f"All files saved to: {os.path.abspath(output_dir)}")
+    report_lines = [
+        "ENHANCED METRICS ANALYSIS REPORT",
+        "=" * 50,
+        "",
+        f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Total charts generated: {len(generated_charts)}",
+        f"Charts reused from a previous run: {len(reused_charts)}",
+        f"Dashboard {'reused' if dashboard_reused else 'generated'}: {dashboard_path}",
+        "",
+        "METRIC IMPROVEMENT SUMMARY:",
+        "-" * 30,
+    ]
+
+    for metric, stats in summary_stats.items():
+        report_lines += [
+            "",
+            f"{metric}:",
+            f"  Average Improvement: {stats['avg_improvement']:.2f}%",
+            f"  Best Case: {stats['max_improvement']:.2f}%",
+            f"  Worst Case: {stats['min_improvement']:.2f}%",
+            f"  Scenarios Tested: {stats['scenarios_count']}",
+        ]
+
+    report_lines += ["", "GENERATED CHARTS:", "-" * 15]
+    report_lines += [f"  {Path(chart).name}" for chart in generated_charts]
+    if reused_charts:
+        report_lines += ["", "REUSED CHARTS:", "-" * 13]
+        report_lines += [f"  {Path(chart).name}" for chart in reused_charts]
+
+    # Assemble the whole report in memory and write it in one go
+    report_path = output_dir / f"metrics_summary_report_{timestamp}.txt"
+    report_path.write_text("\n".join(report_lines) + "\n")
+
+    print(f"\n✅ COMPLETE! Generated {len(generated_charts)} enhanced charts, reused {len(reused_charts)}")
+    print(f"All files saved to: {output_dir.resolve()}")
     print(f"Summary report: {report_path}")
     print(f"Dashboard: {dashboard_path}")
 
@@ -314,12 +410,10 @@ def main():
     print(f"\nQUICK SUMMARY:")
     print(f"Top performing metrics (by average improvement):")
 
-    top_metrics = sorted(summary_stats.items(),
-                        key=lambda x: x[1]['avg_improvement'],
-                        reverse=True)[:3]
+    top_metrics = stats_df['avg_improvement'].nlargest(3)
 
-    for i, (metric, stats) in enumerate(top_metrics, 1):
-        print(f"  {i}. {metric}: {stats['avg_improvement']:.1f}% improvement")
+    for i, (metric, avg_improvement) in enumerate(top_metrics.items(), 1):
+        print(f"  {i}. {metric}: {avg_improvement:.1f}% improvement")
 
 if __name__ == "__main__":
     main()
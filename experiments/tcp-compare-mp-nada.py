@@ -1,29 +1,98 @@
+import argparse
+import array
+import asyncio
+import collections
+import gzip
+import hashlib
+import json
+import multiprocessing
 import os
+import pickle
+import shutil
 import subprocess
+import tempfile
 import pandas as pd
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 import re
 import numpy as np
-import seaborn as sns
 import sys
+from types import MappingProxyType
+
+# --no-plots only writes the CSV/Parquet results (e.g. in CI); the plotting stack is
+# then never imported. Worker processes get the setting through init_worker
+GENERATE_PLOTS = True
+
+def load_plotting():
+    """Import and configure matplotlib; runs once per process, and not at all with --no-plots."""
+    global matplotlib, plt, font_manager, Figure, Image
+    import matplotlib
+    matplotlib.use('Agg')  # Charts are only written to files, no GUI needed
+    matplotlib.rcParams['savefig.bbox'] = 'standard'  # Render each PNG once, never a tight-bbox second pass
+    matplotlib.rcParams['font.family'] = 'DejaVu Sans'  # Bundled with matplotlib, resolves without a system font scan
+    matplotlib.rcParams['path.simplify'] = True
+    # Slightly above the 1/9 default: thins the dense time-series lines without visibly
+    # flattening their peaks, which a threshold near 1.0 does
+    matplotlib.rcParams['path.simplify_threshold'] = 0.2
+    matplotlib.rcParams['agg.path.chunksize'] = 10000
+    import matplotlib.pyplot as plt
+    from matplotlib import font_manager
+    from matplotlib.figure import Figure
+    from PIL import Image
+
+    # Resolve the chart font once up front so the first figure does not pay for the lookup
+    font_manager.fontManager.findfont('DejaVu Sans')
+
+def init_worker(generate_plots):
+    """Set up a spawned worker process the way the main process was set up."""
+    global GENERATE_PLOTS
+    GENERATE_PLOTS = generate_plots
+    if generate_plots:
+        load_plotting()
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_DIR = os.path.join(script_dir, "../results/comparison")
-print(f"Using output directory: {OUTPUT_DIR}")
 
-# Create output directory immediately
-try:
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+def prepare_output_dir():
+    """Create the output directory and make sure it is writable, exiting if not."""
+    print(f"Using output directory: {OUTPUT_DIR}")
+
+    try:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+    except Exception as e:
+        print(f"❌ ERROR: Could not create output directory: {e}")
+        sys.exit(1)
+
     # Test if we can actually write to it
-    test_file = os.path.join(OUTPUT_DIR, "directory_test.txt")
-    with open(test_file, 'w') as f:
-        f.write("Output directory is writable\n")
-    os.remove(test_file)  # Clean up test file
+    if not os.access(OUTPUT_DIR, os.W_OK | os.X_OK):
+        print(f"❌ ERROR: Could not write to output directory: {OUTPUT_DIR}")
+        sys.exit(1)
     print(f"✅ Successfully verified output directory is writable")
-except Exception as e:
-    print(f"❌ ERROR: Could not write to output directory: {e}")
-    sys.exit(1)
+
+# Simulations are independent ns-3 processes, so run up to one per core at a time
+# (override with --jobs N)
+MAX_PARALLEL_SIMULATIONS = os.cpu_count() or 1
+
+# stdout is streamed to disk; of stderr only the last lines are kept for error reports
+STDERR_TAIL_LINES = 200
+STDOUT_CHUNK_SIZE = 2**16
+RAW_OUTPUT_BUFFER_SIZE = 2**20  # Pipe reads are often smaller; batch them into large writes
+
+# Parsed simulation results are cached on disk, keyed by the command line, the
+# scratch source and the sources of the NADA/multipath models under MODEL_SOURCE_DIR
+# (relative to the ns-3 root). Bump CACHE_VERSION (or pass --no-cache) to force
+# fresh runs.
+CACHE_VERSION = 2
+CACHE_DIR = os.path.join(OUTPUT_DIR, ".cache")
+MODEL_SOURCE_DIR = os.path.join("src", "nada")
+USE_SIMULATION_CACHE = True
+
+# Each finished scenario's comparison rows are appended here as a Parquet
+# dataset partitioned by scenario (needs pyarrow; the final CSV is always written)
+SUMMARY_DATASET_DIR = os.path.join(OUTPUT_DIR, "summary_dataset")
 
 PATH_SELECTION_STRATEGIES = [
     {"name": "Dynamic RTT Weights", "strategy": 0},
@@ -35,6 +104,15 @@ PATH_SELECTION_STRATEGIES = [
 ]
 
 
+# Parameters shared by most base scenarios; each scenario's params only list
+# what differs and are merged over these in generate_combined_scenarios()
+SCENARIO_DEFAULTS = MappingProxyType({
+    "frameRate": 60,
+    "simulationTime": 60,
+    "competingIntensityA": 0.8,
+    "competingIntensityB": 0.8
+})
+
 BASE_SIMULATION_SCENARIOS = [
     # 1. Legacy Broadband - Moderate congestion
     {
@@ -47,10 +125,8 @@ BASE_SIMULATION_SCENARIOS = [
             "delayMs2": 50,
             "frameRate": 30,
             "maxPackets": 3000,
-            "simulationTime": 60,
             "competingSourcesA": 8,      # Creates ~32 Mbps competing traffic
             "competingSourcesB": 6,      # Creates ~24 Mbps competing traffic
-            "competingIntensityA": 0.8,
             "competingIntensityB": 0.85
         }
     },
@@ -64,9 +140,7 @@ BASE_SIMULATION_SCENARIOS = [
             "dataRate2": "50Mbps",       # Secondary slow link
             "delayMs1": 20,
             "delayMs2": 80,
-            "frameRate": 60,
             "maxPackets": 6000,
-            "simulationTime": 60,
             "competingSourcesA": 10,     # Creates ~40 Mbps competing (20% of 200Mbps)
             "competingSourcesB": 8,      # Creates ~32 Mbps competing (64% of 50Mbps - heavy!)
             "competingIntensityA": 0.75,
@@ -83,9 +157,7 @@ BASE_SIMULATION_SCENARIOS = [
             "dataRate2": "500Mbps",
             "delayMs1": 40,
             "delayMs2": 50,
-            "frameRate": 60,
             "maxPackets": 4500,
-            "simulationTime": 60,
             "competingSourcesA": 12,     # Creates ~48 Mbps competing traffic
             "competingSourcesB": 12,     # Creates ~48 Mbps competing traffic
             "competingIntensityA": 0.85,
@@ -102,13 +174,9 @@ BASE_SIMULATION_SCENARIOS = [
             "dataRate2": "600Mbps",
             "delayMs1": 18,
             "delayMs2": 22,
-            "frameRate": 60,
             "maxPackets": 10000,
-            "simulationTime": 60,
             "competingSourcesA": 10,     # Creates ~40 Mbps competing (6.7% of 600Mbps)
-            "competingSourcesB": 10,     # Creates ~40 Mbps competing (6.7% of 600Mbps)
-            "competingIntensityA": 0.8,
-            "competingIntensityB": 0.8
+            "competingSourcesB": 10     # Creates ~40 Mbps competing (6.7% of 600Mbps)
         }
     },
 
@@ -121,9 +189,7 @@ BASE_SIMULATION_SCENARIOS = [
             "dataRate2": "800Mbps",      # 5G - variable, moderate congestion
             "delayMs1": 10,
             "delayMs2": 45,
-            "frameRate": 60,
             "maxPackets": 12000,
-            "simulationTime": 60,
             "competingSourcesA": 8,      # Creates ~32 Mbps competing (3.2% of 1Gbps)
             "competingSourcesB": 12,     # Creates ~48 Mbps competing (6% of 800Mbps)
             "competingIntensityA": 0.7,
@@ -144,9 +210,7 @@ BASE_SIMULATION_SCENARIOS = [
             "maxPackets": 20000,
             "simulationTime": 50,        # 50 seconds allows 10 sources max
             "competingSourcesA": 10,     # Creates ~40 Mbps competing (2% of 2Gbps)
-            "competingSourcesB": 8,      # Creates ~32 Mbps competing (2.7% of 1.2Gbps)
-            "competingIntensityA": 0.8,
-            "competingIntensityB": 0.8
+            "competingSourcesB": 8      # Creates ~32 Mbps competing (2.7% of 1.2Gbps)
         }
     },
 
@@ -183,8 +247,6 @@ BASE_SIMULATION_SCENARIOS = [
             "simulationTime": 40,        # 40 seconds allows 8 sources max
             "competingSourcesA": 8,      # Creates ~32 Mbps competing (0.53% of 6Gbps)
             "competingSourcesB": 8,      # Creates ~32 Mbps competing (0.53% of 6Gbps)
-            "competingIntensityA": 0.8,
-            "competingIntensityB": 0.8,
             "packetSize": 1500
         }
     },
@@ -198,9 +260,7 @@ BASE_SIMULATION_SCENARIOS = [
             "dataRate2": "600Mbps",      # Satellite
             "delayMs1": 20,
             "delayMs2": 650,             # High latency satellite
-            "frameRate": 60,
             "maxPackets": 8000,
-            "simulationTime": 60,
             "competingSourcesA": 8,      # Creates ~32 Mbps competing (4% of 800Mbps)
             "competingSourcesB": 12,     # Creates ~48 Mbps competing (8% of 600Mbps)
             "competingIntensityA": 0.7,
@@ -276,7 +336,8 @@ def calculate_adaptive_params(data_rate_str, simulation_time=60):
 def apply_fast_mode_optimizations():
     """Apply optimizations for faster comparative testing"""
     for scenario in BASE_SIMULATION_SCENARIOS:
-        params = scenario["params"]
+        # Fill in the shared defaults so they are reduced along with explicit values
+        params = scenario["params"] = {**SCENARIO_DEFAULTS, **scenario["params"]}
 
         # More aggressive reductions for high-speed scenarios
         data_rate1 = params.get('dataRate1', params.get('dataRate', '1Mbps'))
@@ -310,16 +371,18 @@ def apply_fast_mode_optimizations():
         if "frameRate" in params and 'Gbps' in data_rate1:
             params["frameRate"] = min(30, params["frameRate"])
 
-# Function to create a scenario folder
-def get_scenario_folder(scenario_name):
-    """Create and return path to scenario-specific folder"""
-    folder_name = scenario_name.lower().replace(' ', '_')
-    folder_path = os.path.join(OUTPUT_DIR, folder_name)
-    os.makedirs(folder_path, exist_ok=True)
-    return folder_path
+def build_simulations():
+    """Build ns-3 once up front so parallel runs do not race on the build step"""
+    print("Building ns-3 before running simulations...")
+    result = subprocess.run(["./ns3", "build"], capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"ns-3 build failed with code {result.returncode}")
+        print(f"Error: {result.stderr}")
+        return False
+    return True
 
-def run_simulation(script_name, params=None):
-    """Run the specified simulation script with parameters and return the output."""
+def build_argv(script_name, params=None):
+    """Build the ns-3 command line for a simulation script and its parameters."""
     if params:
         # Auto-calculate adaptive parameters if not already set
         data_rate1 = params.get('dataRate1', params.get('dataRate', '1Mbps'))
@@ -336,89 +399,226 @@ def run_simulation(script_name, params=None):
                     params[key] = value
                     print(f"Auto-set {key}={value} for {data_rate1}")
 
-    cmd_string = script_name
-    if params:
-        for key, value in params.items():
-            cmd_string += f" --{key}={value}"
-
-    # Create the command list with quotes around the full command string
-    cmd = ["./ns3", "run", f'"{cmd_string}"']
+    return _serialize_argv(script_name, tuple(params.items()) if params else ())
 
-    print(f"Running simulation: {' '.join(cmd)}")
-    try:
-        timeout = 1800 # 30 mins
+@lru_cache(maxsize=None)
+def _serialize_argv(script_name, param_items):
+    cmd_string = script_name + "".join(f" --{key}={value}" for key, value in param_items)
 
-        if params:
-            strategy = params.get('pathSelectionStrategy', 0)
-            data_rate1 = params.get('dataRate1', '1Mbps')
-            max_packets = params.get('maxPackets', 1000)
+    # Quote the full command string; ns-3 is built once in main(), so skip the
+    # per-run build check
+    return ("./ns3", "run", "--no-build", f'"{cmd_string}"')
 
+@lru_cache(maxsize=None)
+def model_sources_digest():
+    """Hash every file under MODEL_SOURCE_DIR, or return None if it does not exist."""
+    if not os.path.isdir(MODEL_SOURCE_DIR):
+        return None
 
-        if 'Gbps' in data_rate1:
-            rate_val = float(data_rate1.replace('Gbps', ''))
-            if rate_val >= 10:      # 10Gbps+
-                timeout = 3600      # 60 minutes
-            elif rate_val >= 5:     # 5Gbps+
-                timeout = 2700      # 45 minutes
-            elif rate_val >= 1:     # 1Gbps+
-                timeout = 2400      # 40 minutes
+    hasher = hashlib.blake2b(digest_size=16)
+    for root, dirs, files in os.walk(MODEL_SOURCE_DIR):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            hasher.update(os.path.relpath(path, MODEL_SOURCE_DIR).encode())
+            with open(path, 'rb') as f:
+                hasher.update(f.read())
+    return hasher.hexdigest()
+
+def simulation_cache_path(cmd):
+    """Return the cache file for a simulation command built by build_argv."""
+    script_name = cmd[-1].strip('"').split()[0]
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(json.dumps([CACHE_VERSION, list(cmd), model_sources_digest()]).encode())
+    try:
+        with open(f"{script_name}.cc", 'rb') as f:
+            hasher.update(f.read())
+    except OSError:
+        pass
+    return os.path.join(CACHE_DIR, f"{hasher.hexdigest()}.pkl.gz")
+
+def load_cached_simulation(cache_path, raw_path):
+    """Restore a cached raw output to raw_path and return its stats, or None if not cached."""
+    try:
+        with gzip.open(cache_path, 'rb') as f:
+            stats = pickle.load(f)
+            # The raw output follows the pickled stats in the same stream
+            with open(raw_path, 'wb') as raw_file:
+                shutil.copyfileobj(f, raw_file)
+        return stats
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Ignoring unreadable cache entry {cache_path}: {e}")
+        return None
 
-        if max_packets > 100000:
-            timeout = max(timeout, 4800)  # 80 minutes for very large packet counts
-        elif max_packets > 50000:
-            timeout = max(timeout, 3600)  # 60 minutes for large packet counts
+def store_cached_simulation(cache_path, raw_path, stats):
+    """Write a simulation result to the cache, replacing any previous entry atomically."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, 'wb', compresslevel=1) as f:
+            pickle.dump(stats, f, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(raw_path, 'rb') as raw_file:
+                shutil.copyfileobj(raw_file, f)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Could not cache simulation result: {e}")
+
+def read_output_head(raw_path, num_lines=10):
+    """Return the first lines of a raw output file."""
+    with open(raw_path, errors='replace') as f:
+        return "".join(islice(f, num_lines)).rstrip('\n')
+
+async def run_simulation(cmd, raw_path, params=None, semaphore=None):
+    """Run a simulation command built by build_argv; params only size the timeout.
+
+    The raw output is written to raw_path as it arrives. Returns the statistics
+    parsed from it, or None if the simulation failed or printed nothing.
+    """
+    timeout = 1800 # 30 mins
+
+    params = params or {}
+    data_rate1 = params.get('dataRate1', '1Mbps')
+    max_packets = params.get('maxPackets', 1000)
+
+
+    if 'Gbps' in data_rate1:
+        rate_val = float(data_rate1.replace('Gbps', ''))
+        if rate_val >= 10:      # 10Gbps+
+            timeout = 3600      # 60 minutes
+        elif rate_val >= 5:     # 5Gbps+
+            timeout = 2700      # 45 minutes
+        elif rate_val >= 1:     # 1Gbps+
+            timeout = 2400      # 40 minutes
+
+    if max_packets > 100000:
+        timeout = max(timeout, 4800)  # 80 minutes for very large packet counts
+    elif max_packets > 50000:
+        timeout = max(timeout, 3600)  # 60 minutes for large packet counts
+
+    cache_path = simulation_cache_path(cmd)
+    if USE_SIMULATION_CACHE:
+        stats = load_cached_simulation(cache_path, raw_path)
+        if stats:
+            print(f"♻️ Reusing cached simulation: {' '.join(cmd)}")
+            report_parsed_stats(stats, read_output_head(raw_path))
+            return stats
+
+    async with semaphore or asyncio.Semaphore(1):
+        print(f"Running simulation: {' '.join(cmd)}")
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                limit=2**20)
+
+            # Parse stdout line by line while the simulation is still running, and
+            # stream it to disk instead of holding the whole output in memory
+            stats = new_stats()
+            parser = parse_stream(stats)
+            next(parser)
+            part_path = f"{raw_path}.part"
+
+            with open(part_path, 'wb', buffering=RAW_OUTPUT_BUFFER_SIZE) as raw_file:
+                async def read_stdout():
+                    # Read in large chunks and hand the parser every complete line
+                    # of a chunk at once; a trailing partial line waits for the next
+                    pending = b''
+                    while chunk := await proc.stdout.read(STDOUT_CHUNK_SIZE):
+                        raw_file.write(chunk)
+                        head, newline, pending = (pending + chunk).rpartition(b'\n')
+                        if newline:
+                            parser.send((head + newline).decode(errors='replace'))
+                    if pending:
+                        parser.send(pending.decode(errors='replace'))
+
+                # NS_LOG output goes to stderr and can be huge; only its tail is
+                # needed to report a failure
+                stderr_tail = collections.deque(maxlen=STDERR_TAIL_LINES)
+
+                async def read_stderr():
+                    async for raw_line in proc.stderr:
+                        stderr_tail.append(raw_line)
+
+                try:
+                    await asyncio.wait_for(
+                        asyncio.gather(read_stdout(), read_stderr(), proc.wait()),
+                        timeout=timeout)
+                    timed_out = False
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    timed_out = True
+
+            if timed_out:
+                print(f"Simulation timed out after {timeout // 60} minutes")
+            elif proc.returncode != 0:
+                print(f"Simulation failed with code {proc.returncode}")
+                print(f"Error: {b''.join(stderr_tail).decode(errors='replace')}")
+
+            # Keep raw output only for runs that completed and printed something
+            if timed_out or proc.returncode != 0 or os.path.getsize(part_path) == 0:
+                os.remove(part_path)
+                return None
+
+            os.replace(part_path, raw_path)
+            report_parsed_stats(stats, read_output_head(raw_path))
+            store_cached_simulation(cache_path, raw_path, stats)
+            return stats
+        except Exception as e:
+            print(f"Error running simulation: {e}")
+            return None
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+# Per-line statistics patterns in priority order: the first one found on a line wins.
+# Path-specific patterns only apply once a "Path N:" header has been seen.
+_METRIC_PATTERNS = [
+    r"Throughput: (?P<throughput>[0-9.]+) Mbps",
+    r"Mean delay: (?P<delay>[0-9.e-]+) seconds",
+    r"Packet loss: (?P<loss>[0-9.]+)%",
+    r"Mean jitter: (?P<jitter>[0-9.e-]+) seconds",
+    r"Path (?P<path>\d+):",
+]
+_PATH_METRIC_PATTERNS = [
+    r"Rate: (?P<path_rate>[0-9.]+) Mbps",
+    r"RTT: (?P<path_rtt>[0-9.]+) ms",
+    r"Packets sent: (?P<path_sent>[0-9]+)",
+    r"Packets acked: (?P<path_acked>[0-9]+)",
+    r"Weight: (?P<path_weight>[0-9.]+)",
+]
+_DELIVERY_PATTERNS = [
+    r"Total packets sent: (?P<packets_sent>[0-9]+)",
+    r"Total packets delivered: (?P<packets_delivered>[0-9]+)",
+    r"Total bytes sent: (?P<bytes_sent>[0-9]+)",
+    r"Total bytes delivered: (?P<bytes_delivered>[0-9]+)",
+    r"Path switch: from path (?P<switch_from>\d+) to path (?P<switch_to>\d+)",
+    r"Quality changed: (?P<quality_from>[0-9.]+) -> (?P<quality_to>[0-9.]+)",
+    r"Average buffer length: (?P<buffer_length>[0-9.]+) ms",
+    r"Buffer underruns: (?P<buffer_underruns>[0-9]+)",
+]
 
-        if result.returncode != 0:
-            print(f"Simulation failed with code {result.returncode}")
-            print(f"Error: {result.stderr}")
-            return None
+_STATS_PATTERNS = _METRIC_PATTERNS + _PATH_METRIC_PATTERNS + _DELIVERY_PATTERNS
 
-        return result.stdout
-    except subprocess.TimeoutExpired:
-        print("Simulation timed out after 10 minutes")
-        return None
-    except Exception as e:
-        print(f"Error running simulation: {e}")
-        return None
+# All patterns merged into one alternation; each alternative's priority is keyed by
+# the name of its last group, which is what Match.lastgroup reports. ns-3 output is
+# plain ASCII, so re.ASCII lets \d and the character classes skip Unicode lookups.
+_STATS_RE = re.compile("|".join(_STATS_PATTERNS), re.ASCII)
+_STATS_PRIORITY = {
+    re.findall(r"\?P<(\w+)>", pattern)[-1]: priority
+    for priority, pattern in enumerate(_STATS_PATTERNS)
+}
+_PATH_METRIC_KEYS = {re.findall(r"\?P<(\w+)>", pattern)[-1] for pattern in _PATH_METRIC_PATTERNS}
 
-def parse_output(output):
-    """Parse the simulation output and extract relevant statistics."""
-    if not output:
-        return None
+def new_stats():
+    """Return an empty statistics dict in the shape produced by the parser.
 
-    # Use regular expressions for more robust parsing
-    throughput_re = re.compile(r"Throughput: ([0-9.]+) Mbps")
-    delay_re = re.compile(r"Mean delay: ([0-9.e-]+) seconds")
-    loss_re = re.compile(r"Packet loss: ([0-9.]+)%")
-    jitter_re = re.compile(r"Mean jitter: ([0-9.e-]+) seconds")
-
-    buffer_length_re = re.compile(r"Average buffer length: ([0-9.]+) ms")
-    buffer_underruns_re = re.compile(r"Buffer underruns: ([0-9]+)")
-
-    # For multipath, also look for path-specific stats
-    path_re = re.compile(r"Path (\d+):")
-    path_rate_re = re.compile(r"Rate: ([0-9.]+) Mbps")
-    path_rtt_re = re.compile(r"RTT: ([0-9.]+) ms")
-    path_packets_sent_re = re.compile(r"Packets sent: ([0-9]+)")
-    path_packets_acked_re = re.compile(r"Packets acked: ([0-9]+)")
-    path_weight_re = re.compile(r"Weight: ([0-9.]+)")
-
-    packets_sent_re = re.compile(r"Total packets sent: ([0-9]+)")
-    packets_delivered_re = re.compile(r"Total packets delivered: ([0-9]+)")
-    bytes_sent_re = re.compile(r"Total bytes sent: ([0-9]+)")
-    bytes_delivered_re = re.compile(r"Total bytes delivered: ([0-9]+)")
-
-    path_switch_re = re.compile(r"Path switch: from path (\d+) to path (\d+)")
-    quality_change_re = re.compile(r"Quality changed: ([0-9.]+) -> ([0-9.]+)")
-
-    lines = output.split('\n')
-    stats = {
-        'throughput': [],
-        'delay': [],
-        'loss': [],
-        'jitter': [],
+    Numeric series are array.array('d') buffers: raw doubles instead of boxed
+    floats, and np.asarray can read them without copying.
+    """
+    return {
+        'throughput': array.array('d'),
+        'delay': array.array('d'),
+        'loss': array.array('d'),
+        'jitter': array.array('d'),
         'paths': {},
         'delivery_stats': {
             'packets_sent': 0,
@@ -427,133 +627,86 @@ def parse_output(output):
             'bytes_delivered': 0
         },
         'path_switches': [],
-        'quality_changes': []
-    }
-
-    stats['buffer_stats'] = {
-        'length': [],
-        'underruns': 0,
-        'average_ms': 0
+        'quality_changes': [],
+        'buffer_stats': {
+            'length': array.array('d'),
+            'underruns': 0,
+            'average_ms': 0
+        }
     }
 
+def apply_stat(stats, match, current_path):
+    """Store one parsed statistic in stats and return the (possibly new) current path."""
+    key = match.lastgroup
+    value = match.group(key)
+
+    if key in ('throughput', 'delay', 'loss', 'jitter'):
+        stats[key].append(float(value))
+    elif key == 'path':
+        current_path = int(value)
+        if current_path not in stats['paths']:
+            stats['paths'][current_path] = {
+                'rate': array.array('d'), 'rtt': array.array('d'),
+                'sent': 0, 'acked': 0, 'weight': 0
+            }
+    elif key == 'path_rate':
+        stats['paths'][current_path]['rate'].append(float(value))
+    elif key == 'path_rtt':
+        stats['paths'][current_path]['rtt'].append(float(value))
+    elif key == 'path_sent':
+        stats['paths'][current_path]['sent'] = int(value)
+    elif key == 'path_acked':
+        stats['paths'][current_path]['acked'] = int(value)
+    elif key == 'path_weight':
+        stats['paths'][current_path]['weight'] = float(value)
+    elif key in stats['delivery_stats']:
+        stats['delivery_stats'][key] = int(value)
+    elif key == 'switch_to':
+        stats['path_switches'].append((int(match.group('switch_from')), int(value)))
+    elif key == 'quality_to':
+        stats['quality_changes'].append((float(match.group('quality_from')), float(value)))
+    elif key == 'buffer_length':
+        stats['buffer_stats']['average_ms'] = float(value)
+        stats['buffer_stats']['length'].append(float(value))
+    elif key == 'buffer_underruns':
+        stats['buffer_stats']['underruns'] = int(value)
+
+    return current_path
+
+def parse_stream(stats):
+    """Generator that accumulates blocks of complete output lines sent to it into stats."""
     current_path = None
 
-    for line in lines:
-        # Extract throughput
-        throughput_match = throughput_re.search(line)
-        if throughput_match:
-            stats['throughput'].append(float(throughput_match.group(1)))
-            continue
-
-        # Extract delay
-        delay_match = delay_re.search(line)
-        if delay_match:
-            stats['delay'].append(float(delay_match.group(1)))
-            continue
-
-        # Extract loss percentage
-        loss_match = loss_re.search(line)
-        if loss_match:
-            stats['loss'].append(float(loss_match.group(1)))
-            continue
-
-        # Extract jitter
-        jitter_match = jitter_re.search(line)
-        if jitter_match:
-            stats['jitter'].append(float(jitter_match.group(1)))
-            continue
-
-        # Check for path information in multipath output
-        path_match = path_re.search(line)
-        if path_match:
-            current_path = int(path_match.group(1))
-            if current_path not in stats['paths']:
-                stats['paths'][current_path] = {
-                    'rate': [], 'rtt': [], 'sent': 0, 'acked': 0, 'weight': 0
-                }
-            continue
-
-        if current_path is not None:
-            # Extract path rate
-            path_rate_match = path_rate_re.search(line)
-            if path_rate_match:
-                stats['paths'][current_path]['rate'].append(float(path_rate_match.group(1)))
-                continue
-
-            # Extract path RTT
-            path_rtt_match = path_rtt_re.search(line)
-            if path_rtt_match:
-                stats['paths'][current_path]['rtt'].append(float(path_rtt_match.group(1)))
+    while True:
+        text = yield
+
+        # One finditer over the whole block keeps the scan inside the regex engine.
+        # No pattern can match across a newline, so matches are grouped back into
+        # lines by position, and only one statistic is taken per line: when a line
+        # holds several matches keep the highest-priority one
+        best = None
+        line_end = -1
+        for match in _STATS_RE.finditer(text):
+            if match.start() > line_end:
+                if best:
+                    current_path = apply_stat(stats, best, current_path)
+                    best = None
+                line_end = text.find('\n', match.start())
+                if line_end < 0:
+                    line_end = len(text)
+            # Path-specific stats only count once a path header has been seen
+            if current_path is None and match.lastgroup in _PATH_METRIC_KEYS:
                 continue
+            if best is None or _STATS_PRIORITY[match.lastgroup] < _STATS_PRIORITY[best.lastgroup]:
+                best = match
+        if best:
+            current_path = apply_stat(stats, best, current_path)
 
-            # Extract packets sent
-            packets_sent_match = path_packets_sent_re.search(line)
-            if packets_sent_match:
-                stats['paths'][current_path]['sent'] = int(packets_sent_match.group(1))
-                continue
-
-            # Extract packets acked
-            packets_acked_match = path_packets_acked_re.search(line)
-            if packets_acked_match:
-                stats['paths'][current_path]['acked'] = int(packets_acked_match.group(1))
-                continue
-
-            # Extract path weight
-            weight_match = path_weight_re.search(line)
-            if weight_match:
-                stats['paths'][current_path]['weight'] = float(weight_match.group(1))
-                continue
-
-        packets_sent_match = packets_sent_re.search(line)
-        if packets_sent_match:
-            stats['delivery_stats']['packets_sent'] = int(packets_sent_match.group(1))
-            continue
-
-        packets_delivered_match = packets_delivered_re.search(line)
-        if packets_delivered_match:
-            stats['delivery_stats']['packets_delivered'] = int(packets_delivered_match.group(1))
-            continue
-
-        bytes_sent_match = bytes_sent_re.search(line)
-        if bytes_sent_match:
-            stats['delivery_stats']['bytes_sent'] = int(bytes_sent_match.group(1))
-            continue
-
-        bytes_delivered_match = bytes_delivered_re.search(line)
-        if bytes_delivered_match:
-            stats['delivery_stats']['bytes_delivered'] = int(bytes_delivered_match.group(1))
-            continue
-
-        path_switch_match = path_switch_re.search(line)
-        if path_switch_match:
-            from_path = int(path_switch_match.group(1))
-            to_path = int(path_switch_match.group(2))
-            stats['path_switches'].append((from_path, to_path))
-            continue
-
-        quality_change_match = quality_change_re.search(line)
-        if quality_change_match:
-            from_quality = float(quality_change_match.group(1))
-            to_quality = float(quality_change_match.group(2))
-            stats['quality_changes'].append((from_quality, to_quality))
-            continue
-
-        buffer_length_match = buffer_length_re.search(line)
-        if buffer_length_match:
-            stats['buffer_stats']['average_ms'] = float(buffer_length_match.group(1))
-            stats['buffer_stats']['length'].append(float(buffer_length_match.group(1)))
-            continue
-
-        # Extract buffer underruns
-        buffer_underruns_match = buffer_underruns_re.search(line)
-        if buffer_underruns_match:
-            stats['buffer_stats']['underruns'] = int(buffer_underruns_match.group(1))
-            continue
-
-    # Check if we parsed any data
+def report_parsed_stats(stats, output_head):
+    """Print a short summary of what was parsed, or a warning if nothing was."""
     if not stats['throughput'] and not stats['delay'] and not stats['loss']:
         print("Warning: No metrics were parsed from the output. Check the simulation output format.")
-        print("First few lines of output:", "\n".join(lines[:10]))
+        print("First few lines of output:", output_head)
     else:
         print(f"Parsed {len(stats['throughput'])} throughput values, "
               f"{len(stats['delay'])} delay values, "
@@ -562,47 +715,69 @@ def parse_output(output):
         if stats['paths']:
             print(f"Found data for {len(stats['paths'])} paths")
 
+def parse_output(output):
+    """Parse the simulation output and extract relevant statistics."""
+    if not output:
+        return None
+
+    stats = new_stats()
+    parser = parse_stream(stats)
+    next(parser)
+    parser.send(output)
+
+    report_parsed_stats(stats, "\n".join(output.split('\n', 10)[:10]))
     return stats
 
+def estimate_mos(loss, delay, jitter):
+    """Estimate video MOS (1-5) from loss (%), delay (s) and jitter (s), element-wise over arrays."""
+    mos = 4 * np.clip(1 - (np.asarray(loss, dtype=np.float64) / 20), 0, None)  # Loss above 20% makes video unusable
+    mos *= np.clip(1 - (np.asarray(delay, dtype=np.float64) / 1), 0, None)  # Delay above 1s makes video unusable
+    mos *= np.clip(1 - (np.asarray(jitter, dtype=np.float64) * 20), 0, None)  # Jitter above 50ms makes video unusable
+    mos += 1
+    return mos
+
+def make_path_data(labels=(), utilization=(), weight=()):
+    """Per-path chart data as plain arrays: labels, utilization (%) and normalized weight (%)."""
+    return {
+        'labels': np.array(labels, dtype=object),
+        'utilization': np.asarray(utilization, dtype=np.float64),
+        'weight': np.asarray(weight, dtype=np.float64)
+    }
+
 def analyze_results(multipath_stats, simple_stats):
     """Analyze and compare the results from TCP multipath and TCP simple NADA simulations."""
     # Ensure we have data to analyze
     if not multipath_stats or not simple_stats:
         print("Error: Missing data for analysis")
-        # Return empty DataFrames with the expected structure
+        # Return empty results with the expected structure
         empty_df = pd.DataFrame(columns=['Metric', 'Multipath-NADA', 'Aggregated-NADA', 'Improvement (%)'])
-        path_df = pd.DataFrame(columns=['Path', 'Utilization (%)', 'Weight'])
-        return empty_df, path_df
+        return empty_df, make_path_data()
 
     # Check if the stats dictionaries have the expected structure
     if not isinstance(multipath_stats, dict) or not isinstance(simple_stats, dict):
         print("Error: Invalid stats format")
         empty_df = pd.DataFrame(columns=['Metric', 'Multipath-NADA', 'Aggregated-NADA', 'Improvement (%)'])
-        path_df = pd.DataFrame(columns=['Path', 'Utilization (%)', 'Weight'])
-        return empty_df, path_df
+        return empty_df, make_path_data()
 
-    # Calculate averages safely (avoid division by zero)
-    mp_throughput = sum(multipath_stats['throughput']) / len(multipath_stats['throughput']) if multipath_stats.get('throughput') else 0
-    mp_delay = sum(multipath_stats['delay']) / len(multipath_stats['delay']) if multipath_stats.get('delay') else 0
-    mp_loss = sum(multipath_stats['loss']) / len(multipath_stats['loss']) if multipath_stats.get('loss') else 0
-    mp_jitter = sum(multipath_stats['jitter']) / len(multipath_stats['jitter']) if multipath_stats.get('jitter') else 0
+    # Convert each series to arrays once, as (multipath, simple) pairs
+    series = {
+        key: (np.asarray(multipath_stats.get(key) or [], dtype=np.float64),
+              np.asarray(simple_stats.get(key) or [], dtype=np.float64))
+        for key in ('throughput', 'delay', 'loss', 'jitter')
+    }
 
-    simple_throughput = sum(simple_stats['throughput']) / len(simple_stats['throughput']) if simple_stats.get('throughput') else 0
-    simple_delay = sum(simple_stats['delay']) / len(simple_stats['delay']) if simple_stats.get('delay') else 0
-    simple_loss = sum(simple_stats['loss']) / len(simple_stats['loss']) if simple_stats.get('loss') else 0
-    simple_jitter = sum(simple_stats['jitter']) / len(simple_stats['jitter']) if simple_stats.get('jitter') else 0
+    # Calculate averages safely (avoid division by zero)
+    throughput, delay, loss, jitter = (
+        np.array([arr.mean() if arr.size else 0.0 for arr in series[key]])
+        for key in ('throughput', 'delay', 'loss', 'jitter')
+    )
+    mp_throughput, simple_throughput = throughput
+    mp_delay, simple_delay = delay
+    mp_loss, simple_loss = loss
+    mp_jitter, simple_jitter = jitter
 
     # Calculate MOS (Mean Opinion Score) estimate based on network conditions
-    mp_loss_factor = max(0, 1 - (mp_loss / 20))  # Loss above 20% makes video unusable
-    mp_delay_factor = max(0, 1 - (mp_delay / 1))  # Delay above 1s makes video unusable
-    mp_jitter_factor = max(0, 1 - (mp_jitter * 20))  # Jitter above 50ms makes video unusable
-    mp_mos = 1 + 4 * mp_loss_factor * mp_delay_factor * mp_jitter_factor
-
-    simple_loss_factor = max(0, 1 - (simple_loss / 20))
-    simple_delay_factor = max(0, 1 - (simple_delay / 1))
-    simple_jitter_factor = max(0, 1 - (simple_jitter * 20))
-    simple_mos = 1 + 4 * simple_loss_factor * simple_delay_factor * simple_jitter_factor
-
+    mp_mos, simple_mos = estimate_mos(loss, delay, jitter)
 
     mp_buffer_avg = multipath_stats.get('buffer_stats', {}).get('average_ms', 0)
     mp_buffer_underruns = multipath_stats.get('buffer_stats', {}).get('underruns', 0)
@@ -610,49 +785,23 @@ def analyze_results(multipath_stats, simple_stats):
     simple_buffer_avg = simple_stats.get('buffer_stats', {}).get('average_ms', 0)
     simple_buffer_underruns = simple_stats.get('buffer_stats', {}).get('underruns', 0)
 
-    buffer_metrics = [
-        ['Buffer Length (ms)', mp_buffer_avg, simple_buffer_avg],
-        ['Buffer Underruns', mp_buffer_underruns, simple_buffer_underruns]
-    ]
-
-    # Path utilization for multipath (if available)
-    path_utilization = {}
-    total_weight = 0
-    for path_id, path_stats in multipath_stats.get('paths', {}).items():
-        if path_stats.get('sent', 0) > 0:
-            path_utilization[f"Path {path_id}"] = (path_stats.get('acked', 0) / path_stats['sent']) * 100
-        else:
-            path_utilization[f"Path {path_id}"] = 0
-        total_weight += path_stats.get('weight', 0)
+    # Path utilization and normalized weights for multipath (if available),
+    # computed for all paths at once
+    paths = multipath_stats.get('paths', {})
+    path_sent, path_acked, path_weight = (
+        np.array([path_stats.get(key, 0) for path_stats in paths.values()], dtype=np.float64)
+        for key in ('sent', 'acked', 'weight')
+    )
+    path_utilization = np.divide(path_acked, path_sent,
+                                 out=np.zeros_like(path_sent), where=path_sent > 0) * 100
 
     # Normalize weights if we have them
-    for path_id, path_stats in multipath_stats.get('paths', {}).items():
-        if total_weight > 0:
-            path_stats['norm_weight'] = path_stats.get('weight', 0) / total_weight
-        else:
-            path_stats['norm_weight'] = 0
-
-    # Create main comparison dataframe
-    comparison_df = pd.DataFrame({
-        'Metric': ['Throughput (Mbps)', 'Delay (seconds)', 'Loss (%)', 'Jitter (seconds)', 'Estimated MOS (1-5)'],
-        'Multipath-NADA': [mp_throughput, mp_delay, mp_loss, mp_jitter, mp_mos],
-        'Aggregated-NADA': [simple_throughput, simple_delay, simple_loss, simple_jitter, simple_mos]
-    })
-
-    # Add improvement percentage column
-    comparison_df['Improvement (%)'] = [
-        ((mp_throughput - simple_throughput) / simple_throughput * 100) if simple_throughput else float('nan'),
-        ((simple_delay - mp_delay) / simple_delay * 100) if simple_delay else float('nan'),  # Lower delay is better
-        ((simple_loss - mp_loss) / simple_loss * 100) if simple_loss else float('nan'),  # Lower loss is better
-        ((simple_jitter - mp_jitter) / simple_jitter * 100) if simple_jitter else float('nan'),  # Lower jitter is better
-        ((mp_mos - simple_mos) / simple_mos * 100) if simple_mos else float('nan')  # Higher MOS is better
-    ]
-
+    total_weight = path_weight.sum()
+    path_norm_weight = path_weight / total_weight if total_weight > 0 else np.zeros_like(path_weight)
 
     # Calculate additional performance metrics
     # 1. Throughput Stability (standard deviation)
-    mp_throughput_std = np.std(multipath_stats.get('throughput', [])) if multipath_stats.get('throughput') else 0
-    simple_throughput_std = np.std(simple_stats.get('throughput', [])) if simple_stats.get('throughput') else 0
+    mp_throughput_std, simple_throughput_std = (arr.std() if arr.size else 0 for arr in series['throughput'])
 
     # 2. Path Utilization Ratio and Bandwidth Aggregation Efficiency
     path_utilization_ratio = 0
@@ -684,68 +833,149 @@ def analyze_results(multipath_stats, simple_stats):
     if simple_energy_efficiency == 0 and simple_delivery_stats.get('packets_sent', 0) > 0:
         simple_energy_efficiency = (simple_delivery_stats.get('packets_delivered', 0) / simple_delivery_stats['packets_sent']) * 100
 
-    # Add the new metrics to the comparison dataframe
-    additional_metrics = [
-        ['Throughput Stability (stddev)', mp_throughput_std, simple_throughput_std],
-        ['Path Utilization Ratio (%)', path_utilization_ratio, float('nan')],
-        ['Delivery Efficiency (%)', mp_energy_efficiency, simple_energy_efficiency]  # Renamed from Energy Efficiency
+    # Every compared metric with its direction: +1 when higher is better, -1 when lower is better
+    comparison_metrics = [
+        ('Throughput (Mbps)', mp_throughput, simple_throughput, 1),
+        ('Delay (seconds)', mp_delay, simple_delay, -1),
+        ('Loss (%)', mp_loss, simple_loss, -1),
+        ('Jitter (seconds)', mp_jitter, simple_jitter, -1),
+        ('Estimated MOS (1-5)', mp_mos, simple_mos, 1),
+        ('Throughput Stability (stddev)', mp_throughput_std, simple_throughput_std, -1),
+        ('Path Utilization Ratio (%)', path_utilization_ratio, float('nan'), 1),
+        ('Delivery Efficiency (%)', mp_energy_efficiency, simple_energy_efficiency, 1),  # Renamed from Energy Efficiency
+        ('Buffer Length (ms)', mp_buffer_avg, simple_buffer_avg, 1),
+        ('Buffer Underruns', mp_buffer_underruns, simple_buffer_underruns, -1)
     ]
+    metric_names, mp_values, simple_values, directions = zip(*comparison_metrics)
+    mp_values = np.array(mp_values, dtype=np.float64)
+    simple_values = np.array(simple_values, dtype=np.float64)
+
+    # Improvement relative to Aggregated-NADA, signed so that positive is always better;
+    # undefined (NaN) when the Aggregated-NADA value is zero or missing. The difference
+    # is taken in the better-minus-worse order rather than negated, so equal values
+    # give 0.0 and not -0.0
+    higher_is_better = np.array(directions) > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        improvement = np.where(
+            simple_values != 0,
+            np.where(higher_is_better, mp_values - simple_values, simple_values - mp_values) / simple_values * 100,
+            np.nan
+        )
 
-    for metric in additional_metrics:
-        improvement = float('nan')
-        if not np.isnan(metric[1]) and not np.isnan(metric[2]) and metric[2] != 0:
-            if 'Stability' in metric[0]:
-                # For stability, lower stddev is better
-                improvement = ((simple_throughput_std - mp_throughput_std) / simple_throughput_std) * 100 if simple_throughput_std > 0 else float('nan')
-            else:
-                # For these metrics, higher is better
-                improvement = ((metric[1] - metric[2]) / metric[2]) * 100
-
-        # Use DataFrame.loc to append new rows
-        new_idx = len(comparison_df)
-        comparison_df.loc[new_idx] = {
-            'Metric': metric[0],
-            'Multipath-NADA': metric[1],
-            'Aggregated-NADA': metric[2],
-            'Improvement (%)': improvement
-        }
-
-    for metric in buffer_metrics:
-        improvement = float('nan')
-        if not np.isnan(metric[1]) and not np.isnan(metric[2]) and metric[2] != 0:
-            if 'Underruns' in metric[0]:
-                # For underruns, lower is better (calculate percentage reduction)
-                improvement = ((simple_buffer_underruns - mp_buffer_underruns) / max(1, simple_buffer_underruns)) * 100
-            else:
-                # For buffer length, higher is better
-                improvement = ((mp_buffer_avg - simple_buffer_avg) / simple_buffer_avg) * 100 if simple_buffer_avg > 0 else float('nan')
-
-        new_idx = len(comparison_df)
-        comparison_df.loc[new_idx] = {
-            'Metric': metric[0],
-            'Multipath-NADA': metric[1],
-            'Aggregated-NADA': metric[2],
-            'Improvement (%)': improvement
-        }
+    comparison_df = pd.DataFrame({
+        'Metric': metric_names,
+        'Multipath-NADA': mp_values,
+        'Aggregated-NADA': simple_values,
+        'Improvement (%)': improvement
+    })
 
-    # Create path utilization dataframe if data exists
-    path_df = pd.DataFrame(columns=['Path', 'Utilization (%)', 'Weight'])
-    if path_utilization:
-        path_items = list(path_utilization.items())
-        path_df = pd.DataFrame({
-            'Path': [p[0] for p in path_items],
-            'Utilization (%)': [p[1] for p in path_items],
-            'Weight': [multipath_stats['paths'][int(p[0].split()[1])].get('norm_weight', 0) * 100 for p in path_items]
-        })
+    # Path utilization data is only a handful of values, so keep it as arrays
+    path_data = make_path_data([f"Path {path_id}" for path_id in paths],
+                               path_utilization, path_norm_weight * 100)
 
     print("Comparison Results with Additional Metrics:")
     print(comparison_df)
-    if not path_df.empty:
+    if path_data['labels'].size:
         print("\nPath Utilization:")
-        print(path_df)
+        for label, utilization, weight in zip(path_data['labels'], path_data['utilization'], path_data['weight']):
+            print(f"{label}: utilization {utilization:.2f}%, weight {weight:.2f}%")
+
+    return comparison_df, path_data
+
+
+# Summary charts are written once and rarely re-read, so favour zlib speed over file size
+FAST_PNG_KWARGS = {'compress_level': 1, 'optimize': False}
+
+def _fast_savefig(fig, path, dpi=300):
+    """Rasterize fig with Agg and hand the RGBA buffer straight to Pillow, skipping print_png."""
+    original_dpi = fig.dpi
+    fig.set_dpi(dpi)
+    try:
+        fig.canvas.draw()
+        # Write beside the target and rename, so a chart hard-linked from the cache is
+        # replaced rather than overwritten in place
+        Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).save(
+            f"{path}.tmp", format='PNG', dpi=(dpi, dpi), **FAST_PNG_KWARGS)
+        os.replace(f"{path}.tmp", path)
+    finally:
+        fig.set_dpi(original_dpi)
+
+@lru_cache(maxsize=None)
+def _script_digest():
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+def chart_cache_path(*parts):
+    """Return the cache file for a summary chart, keyed on this script and the plotted data."""
+    hasher = hashlib.blake2b(_script_digest(), digest_size=16)
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            hasher.update(repr(part.shape).encode())
+            hasher.update(part.tobytes())
+        else:
+            hasher.update(repr(part).encode())
+    return os.path.join(CACHE_DIR, "charts", f"{hasher.hexdigest()}.png")
 
-    return comparison_df, path_df
+def _link_or_copy(src, dst):
+    tmp_path = f"{dst}.{os.getpid()}.tmp"
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+def restore_cached_chart(cache_path, path):
+    """Link an identical chart rendered by an earlier run into place; False if there is none."""
+    if not os.path.exists(cache_path):
+        return False
+    try:
+        _link_or_copy(cache_path, path)
+    except OSError:
+        return False
+    print(f"♻️ Reusing cached chart for {path}")
+    return True
 
+def store_cached_chart(cache_path, path):
+    """Keep a freshly rendered chart so identical data is not rendered again."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        _link_or_copy(path, cache_path)
+    except OSError as e:
+        print(f"Could not cache chart {path}: {e}")
+
+def _set_margins(fig, left=0.12, right=0.97, top=0.92, bottom=0.22, wspace=None, hspace=None):
+    """Fixed subplot margins sized for rotated tick labels, used instead of tight_layout()."""
+    fig.subplots_adjust(left=left, right=right, top=top, bottom=bottom, wspace=wspace, hspace=hspace)
+
+@lru_cache(maxsize=None)
+def _scenario_figure(nrows, ncols, width, height):
+    fig = Figure(figsize=(width, height))
+    return fig, fig.subplots(nrows, ncols, squeeze=False).ravel()
+
+def reuse_figure(nrows, ncols, figsize):
+    """Return a figure with cleared axes, reusing one figure per layout across scenarios."""
+    fig, axes = _scenario_figure(nrows, ncols, *figsize)
+    for ax in axes:
+        ax.clear()
+    return fig, axes
+
+def metric_bar_chart(ax, metrics, series, colors=('#1f77b4', '#ff7f0e'), legend=True):
+    """Draw grouped bars per metric straight from arrays, laid out like DataFrame.plot(kind='bar').
+
+    series maps each legend label to its values; missing values are drawn as 0.
+    """
+    tick_pos = np.arange(len(metrics))
+    width = 0.5 / len(series)
+    for i, (label, values) in enumerate(series.items()):
+        ax.bar(tick_pos - 0.25 + (i + 0.5) * width, np.nan_to_num(np.asarray(values, dtype=np.float64)),
+               width, label=label, color=colors[i % len(colors)])
+
+    if len(metrics):
+        ax.set_xlim(tick_pos[0] - 0.5, tick_pos[-1] + 0.5)
+    ax.set_xticks(tick_pos, metrics, rotation=90)
+    ax.set_xlabel('Metric')
+    if legend:
+        ax.legend(loc='best')
 
 def generate_buffer_visualizations(comparison_df, scenario_name, scenario_folder, timestamp):
     """Generate visualizations specifically for buffer metrics."""
@@ -755,10 +985,8 @@ def generate_buffer_visualizations(comparison_df, scenario_name, scenario_folder
         print("No buffer data to visualize")
         return
 
-    plt.figure(figsize=(12, 6))
-
     # Create subplots for different buffer metrics
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
+    fig, (ax1, ax2) = reuse_figure(1, 2, (12, 6))
 
     # Plot buffer length
     buffer_length_data = buffer_data[buffer_data['Metric'] == 'Buffer Length (ms)']
@@ -794,14 +1022,14 @@ def generate_buffer_visualizations(comparison_df, scenario_name, scenario_folder
                     f'{int(height)}',
                     ha='center', va='bottom')
 
-    plt.suptitle(f'Buffer Performance Metrics - {scenario_name}')
-    plt.tight_layout()
+    fig.suptitle(f'Buffer Performance Metrics - {scenario_name}')
+    fig.tight_layout()
 
     buffer_plot = f"{scenario_folder}/buffer_metrics_{timestamp}.png"
-    plt.savefig(buffer_plot)
+    fig.savefig(buffer_plot)
     print(f"Saved buffer metrics plot to {buffer_plot}")
 
-def generate_visualizations(comparison_df, path_df, scenario_name):
+def generate_visualizations(comparison_df, path_data, scenario_name, timestamp):
     """Generate visualizations from the comparison DataFrame."""
     if comparison_df.empty:
         print("No data to visualize")
@@ -809,25 +1037,13 @@ def generate_visualizations(comparison_df, path_df, scenario_name):
 
     # Create scenario folder with absolute path
     scenario_folder = get_scenario_folder(scenario_name)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     print(f"Saving visualizations to: {os.path.abspath(scenario_folder)}")
 
-    # Verify the directory exists and is writable
-    try:
-        test_file = os.path.join(scenario_folder, "test_write.tmp")
-        with open(test_file, 'w') as f:
-            f.write("Test")
-        os.remove(test_file)
-    except Exception as e:
-        print(f"❌ ERROR: Cannot write to visualization directory: {e}")
-        # Try to create it again
-        try:
-            os.makedirs(scenario_folder, exist_ok=True)
-            print(f"Created directory: {scenario_folder}")
-        except Exception as e2:
-            print(f"Failed to create directory: {e2}")
-            return
+    # Verify the directory is writable (answered from cache once it has been checked)
+    if not check_directory_permissions(scenario_folder):
+        print(f"❌ ERROR: Cannot write to visualization directory: {scenario_folder}")
+        return
 
     try:
         # Extract multipath-specific metrics for a separate chart
@@ -841,90 +1057,94 @@ def generate_visualizations(comparison_df, path_df, scenario_name):
         generate_buffer_visualizations(comparison_df, scenario_name, scenario_folder, timestamp)
 
         # Bar chart for comparison of common metrics (excluding buffer metrics and TCP metrics)
-        plt.figure(figsize=(12, 8))
+        fig, (ax, ax2) = reuse_figure(2, 1, (12, 8))
 
         # First subplot for raw values (except MOS, buffer metrics, and TCP metrics)
-        plt.subplot(2, 1, 1)
         metrics_to_plot = common_metrics[~common_metrics['Metric'].isin(['Estimated MOS (1-5)', 'Buffer Length (ms)', 'Buffer Underruns'])]
 
-        ax = metrics_to_plot.set_index('Metric')[['Multipath-NADA', 'Aggregated-NADA']].plot(kind='bar', ax=plt.gca())
-        plt.title(f'Comparison of Multipath-NADA vs Aggregated-NADA NADA - {scenario_name}')
-        plt.ylabel('Value')
-        plt.xticks(rotation=30)
-        plt.grid(axis='y')
+        metric_bar_chart(ax, metrics_to_plot['Metric'].to_numpy(), {
+            'Multipath-NADA': metrics_to_plot['Multipath-NADA'].to_numpy(),
+            'Aggregated-NADA': metrics_to_plot['Aggregated-NADA'].to_numpy()})
+        ax.set_title(f'Comparison of Multipath-NADA vs Aggregated-NADA NADA - {scenario_name}')
+        ax.set_ylabel('Value')
+        ax.tick_params(axis='x', labelrotation=30)
+        ax.grid(axis='y')
 
         # Add value labels on top of bars
         for container in ax.containers:
             ax.bar_label(container, fmt='%.4f')
 
         # Second subplot for MOS
-        plt.subplot(2, 1, 2)
         mos_data = common_metrics[common_metrics['Metric'] == 'Estimated MOS (1-5)']
-        ax2 = mos_data.set_index('Metric')[['Multipath-NADA', 'Aggregated-NADA']].plot(kind='bar', ax=plt.gca(), color=['#1f77b4', '#ff7f0e'])
-        plt.title(f'Video Quality Estimation (MOS) - {scenario_name}')
-        plt.ylabel('Estimated MOS (1-5)')
-        plt.ylim(1, 5)  # MOS is on a 1-5 scale
-        plt.grid(axis='y')
+        metric_bar_chart(ax2, mos_data['Metric'].to_numpy(), {
+            'Multipath-NADA': mos_data['Multipath-NADA'].to_numpy(),
+            'Aggregated-NADA': mos_data['Aggregated-NADA'].to_numpy()})
+        ax2.set_title(f'Video Quality Estimation (MOS) - {scenario_name}')
+        ax2.set_ylabel('Estimated MOS (1-5)')
+        ax2.set_ylim(1, 5)  # MOS is on a 1-5 scale
+        ax2.grid(axis='y')
 
         # Add value labels on top of bars
         for container in ax2.containers:
             ax2.bar_label(container, fmt='%.2f')
 
-        plt.tight_layout()
+        fig.tight_layout()
         comparison_plot = f"{scenario_folder}/comparison_{timestamp}.png"
-        plt.savefig(comparison_plot)
+        fig.savefig(comparison_plot)
         print(f"Saved comparison plot to {comparison_plot}")
 
         # Create a separate visualization for multipath-specific metrics
         if not multipath_data.empty:
-            plt.figure(figsize=(10, 6))
-            ax_mp = multipath_data.set_index('Metric')['Multipath-NADA'].plot(kind='bar', color='green')
-            plt.title(f'Multipath-NADA Specific Metrics - {scenario_name}')
-            plt.ylabel('Value (%)')
-            plt.grid(axis='y')
-            plt.ylim(0, 105)  # Assuming percentages 0-100 with a bit of margin
+            fig, (ax_mp,) = reuse_figure(1, 1, (10, 6))
+            metric_bar_chart(ax_mp, multipath_data['Metric'].to_numpy(),
+                             {'Multipath-NADA': multipath_data['Multipath-NADA'].to_numpy()},
+                             colors=('green',), legend=False)
+            ax_mp.set_title(f'Multipath-NADA Specific Metrics - {scenario_name}')
+            ax_mp.set_ylabel('Value (%)')
+            ax_mp.grid(axis='y')
+            ax_mp.set_ylim(0, 105)  # Assuming percentages 0-100 with a bit of margin
 
             # Add value labels on top of bars
             for container in ax_mp.containers:
                 ax_mp.bar_label(container, fmt='%.1f%%')
 
-            plt.tight_layout()
+            fig.tight_layout()
             multipath_plot = f"{scenario_folder}/multipath_metrics_{timestamp}.png"
-            plt.savefig(multipath_plot)
+            fig.savefig(multipath_plot)
             print(f"Saved multipath-specific metrics plot to {multipath_plot}")
 
         # Create a plot for improvement percentage (only for common metrics)
-        plt.figure(figsize=(10, 6))
+        fig, (ax4,) = reuse_figure(1, 1, (10, 6))
         # Remove NaN values and multipath-only metrics
         improvement_data = common_metrics.dropna(subset=['Improvement (%)'])
 
-        ax4 = improvement_data.set_index('Metric')['Improvement (%)'].plot(kind='bar', color='green')
-        plt.title(f'Performance Improvement of Multipath-NADA over Aggregated-NADA NADA (%) - {scenario_name}')
-        plt.ylabel('Improvement (%)')
-        plt.xticks(rotation=30)
-        plt.grid(axis='y')
-        plt.axhline(y=0, color='r', linestyle='-')  # Add a line at 0% for reference
+        metric_bar_chart(ax4, improvement_data['Metric'].to_numpy(),
+                         {'Improvement (%)': improvement_data['Improvement (%)'].to_numpy()},
+                         colors=('green',), legend=False)
+        ax4.set_title(f'Performance Improvement of Multipath-NADA over Aggregated-NADA NADA (%) - {scenario_name}')
+        ax4.set_ylabel('Improvement (%)')
+        ax4.tick_params(axis='x', labelrotation=30)
+        ax4.grid(axis='y')
+        ax4.axhline(y=0, color='r', linestyle='-')  # Add a line at 0% for reference
 
         # Add value labels on top of bars
         ax4.bar_label(ax4.containers[0], fmt='%.1f%%')
 
-        plt.tight_layout()
+        fig.tight_layout()
         improvement_plot = f"{scenario_folder}/improvement_{timestamp}.png"
-        plt.savefig(improvement_plot)
+        fig.savefig(improvement_plot)
         print(f"Saved improvement plot to {improvement_plot}")
 
         # Create a path utilization chart if we have path data
-        if not path_df.empty:
-            plt.figure(figsize=(8, 6))
-
+        if path_data['labels'].size:
             # Create a bar chart with two metrics per path
-            paths = path_df['Path']
+            paths = path_data['labels']
             x = np.arange(len(paths))
             width = 0.35
 
-            fig, ax = plt.subplots(figsize=(8, 6))
-            rects1 = ax.bar(x - width/2, path_df['Utilization (%)'], width, label='Utilization (%)')
-            rects2 = ax.bar(x + width/2, path_df['Weight'], width, label='Weight (%)')
+            fig, (ax,) = reuse_figure(1, 1, (8, 6))
+            rects1 = ax.bar(x - width/2, path_data['utilization'], width, label='Utilization (%)')
+            rects2 = ax.bar(x + width/2, path_data['weight'], width, label='Weight (%)')
 
             # Set labels and title
             ax.set_title(f'Path Utilization vs Weight - {scenario_name}')
@@ -937,86 +1157,143 @@ def generate_visualizations(comparison_df, path_df, scenario_name):
             ax.bar_label(rects1, fmt='%.1f%%')
             ax.bar_label(rects2, fmt='%.1f%%')
 
-            plt.grid(axis='y')
-            plt.ylim(0, 105)  # 0-100% with a bit of margin
+            ax.grid(axis='y')
+            ax.set_ylim(0, 105)  # 0-100% with a bit of margin
 
-            plt.tight_layout()
+            fig.tight_layout()
             path_plot = f"{scenario_folder}/path_utilization_{timestamp}.png"
-            plt.savefig(path_plot)
+            fig.savefig(path_plot)
             print(f"Saved path utilization plot to {path_plot}")
 
-        plt.close('all')  # Close all figures to free memory
-
     except Exception as e:
         import traceback
         print(f"Error generating visualizations: {e}")
         traceback.print_exc()
 
 
-def generate_summary_visualizations(all_results):
+def generate_summary_visualizations(all_results, timestamp):
     """Generate summary visualizations comparing all scenarios."""
+    # A cross-scenario summary of fewer than two scenarios is degenerate (e.g. a
+    # single-scenario debugging run, or every other simulation failed)
+    scenarios_with_results = sum(not comparison_df.empty for comparison_df, _ in all_results.values())
+    if scenarios_with_results < 2:
+        print("Skipping summary visualizations (need results from at least 2 scenarios)")
+        return
+
     # Create summary folder
     summary_folder = os.path.join(OUTPUT_DIR, "summary")
     os.makedirs(summary_folder, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    # Create a dataframe with all scenarios
-    summary_data = []
-    for scenario_name, (comparison_df, _) in all_results.items():
-        for _, row in comparison_df.iterrows():
-            metric = row['Metric']
-            multipath_value = row['Multipath-NADA']
-            simple_value = row['Aggregated-NADA']
-            improvement = row['Improvement (%)']
-
-            summary_data.append({
-                'Scenario': scenario_name,
-                'Metric': metric,
-                'Multipath-NADA': multipath_value,
-                'Aggregated-NADA': simple_value,
-                'Improvement (%)': improvement
-            })
-
-    summary_df = pd.DataFrame(summary_data)
+    # Create a dataframe with all scenarios, assembled column-wise from the
+    # per-scenario frames; Scenario/Metric are categoricals (sorted like pivot sorts)
+    scenario_names = list(all_results)
+    comparison_dfs = [comparison_df for comparison_df, _ in all_results.values()]
+    combined_df = pd.concat(comparison_dfs, ignore_index=True) if comparison_dfs else pd.DataFrame(
+        columns=['Metric', 'Multipath-NADA', 'Aggregated-NADA', 'Improvement (%)'])
+    scenario_column = np.repeat(scenario_names, [len(comparison_df) for comparison_df in comparison_dfs])
+
+    summary_df = pd.DataFrame({
+        'Scenario': pd.Categorical(scenario_column, categories=sorted(scenario_names)),
+        'Metric': pd.Categorical(combined_df['Metric']),
+        'Multipath-NADA': combined_df['Multipath-NADA'].to_numpy(dtype=np.float64),
+        'Aggregated-NADA': combined_df['Aggregated-NADA'].to_numpy(dtype=np.float64),
+        'Improvement (%)': combined_df['Improvement (%)'].to_numpy(dtype=np.float64)
+    })
 
     # Save summary data
-    summary_df.to_csv(f"{summary_folder}/all_metrics_summary_{timestamp}.csv", index=False)
+    write_csv(summary_df, f"{summary_folder}/all_metrics_summary_{timestamp}.csv")
+    if not GENERATE_PLOTS:
+        return
 
     # Create a heatmap of improvements across all scenarios and metrics
-    plt.figure(figsize=(18, 12))  # Increased figure size
-    pivot_df = summary_df.pivot(index='Metric', columns='Scenario', values='Improvement (%)')
-
-    # Use a diverging colormap centered at 0
-    cmap = sns.diverging_palette(240, 10, as_cmap=True)
+    # Metric x Scenario matrix filled straight from the sorted categorical codes instead of
+    # pivot(); scenarios without any rows (failed runs) are left out like pivot would
+    metric_codes = summary_df['Metric'].cat.codes.to_numpy()
+    scenario_codes = summary_df['Scenario'].cat.codes.to_numpy()
+    metric_names = summary_df['Metric'].cat.categories
+    scenario_names_sorted = summary_df['Scenario'].cat.categories
+    improvement = summary_df['Improvement (%)'].to_numpy()
+    improvement_grid = np.full((len(metric_names), len(scenario_names_sorted)), np.nan)
+    improvement_grid[metric_codes, scenario_codes] = improvement
+    # NaN mask written in the same pass: empty cells plus cells whose improvement is NaN
+    nan_mask = np.ones(improvement_grid.shape, dtype=bool)
+    nan_mask[metric_codes, scenario_codes] = np.isnan(improvement)
+    observed = np.bincount(scenario_codes, minlength=len(scenario_names_sorted)) > 0
+    pivot_df = pd.DataFrame(improvement_grid[:, observed], index=pd.Index(metric_names, name='Metric'),
+                            columns=pd.Index(scenario_names_sorted[observed], name='Scenario'))
+
+    heatmap_values = pivot_df.to_numpy()
 
     # Set a mask for NaN values
-    mask = np.isnan(pivot_df.values)
-
-    # Create the heatmap with better formatting
-    sns.heatmap(pivot_df, annot=True, fmt=".1f", cmap=cmap, center=0,
-                linewidths=.5, cbar_kws={"label": "Improvement %"}, mask=mask,
-                square=False, annot_kws={'size': 8})
-
-    plt.title('Multipath-NADA Improvement (%) Over Aggregated-NADA Across Different Scenarios',
-              fontsize=14, pad=20)
-    plt.xticks(rotation=45, ha='right', fontsize=10)
-    plt.yticks(fontsize=10)
-    plt.tight_layout()
-    plt.savefig(f"{summary_folder}/improvement_heatmap_{timestamp}.png", dpi=300, bbox_inches='tight')
-    plt.close()
-
-    # Create a grouped bar chart comparing Multipath-NADA vs Aggregated-NADA across scenarios for key metrics
+    mask = nan_mask[:, observed]
+
+    # Skip rendering when an earlier run already drew this exact heatmap
+    heatmap_path = f"{summary_folder}/improvement_heatmap_{timestamp}.png"
+    heatmap_cache = chart_cache_path('heatmap', tuple(pivot_df.index), tuple(pivot_df.columns), heatmap_values)
+    if not restore_cached_chart(heatmap_cache, heatmap_path):
+        fig, ax = plt.subplots(figsize=(18, 12))  # Increased figure size
+
+        # Use a diverging colormap centered at 0
+        cmap = plt.get_cmap('RdBu_r')
+        value_range = np.nanmax(np.abs(heatmap_values), initial=0) or 1
+        norm = matplotlib.colors.Normalize(-value_range, value_range)
+
+        # Draw the grid with imshow; masked cells stay blank
+        im = ax.imshow(np.ma.masked_array(heatmap_values, mask), cmap=cmap, norm=norm,
+                       aspect='auto', interpolation='nearest')
+        fig.colorbar(im, ax=ax, label='Improvement %')
+
+        # Thin white lines between cells
+        ax.set_xticks(np.arange(heatmap_values.shape[1] + 1) - .5, minor=True)
+        ax.set_yticks(np.arange(heatmap_values.shape[0] + 1) - .5, minor=True)
+        ax.grid(which='minor', color='white', linewidth=.5)
+        ax.tick_params(which='minor', length=0)
+        ax.spines[:].set_visible(False)
+
+        # Annotate each cell, dark text on light cells and white text on dark ones
+        rgb = cmap(norm(heatmap_values))[..., :3]
+        rgb = np.where(rgb <= .03928, rgb / 12.92, ((rgb + .055) / 1.055) ** 2.4)
+        dark_cell = rgb @ [.2126, .7152, .0722] <= .408
+        for (row, col), value in np.ndenumerate(heatmap_values):
+            if not mask[row, col]:
+                ax.text(col, row, f"{value:.1f}", ha='center', va='center', fontsize=8,
+                        color='white' if dark_cell[row, col] else '.15')
+
+        ax.set_title('Multipath-NADA Improvement (%) Over Aggregated-NADA Across Different Scenarios',
+                     fontsize=14, pad=20)
+        ax.set_xticks(np.arange(heatmap_values.shape[1]))
+        ax.set_xticklabels(pivot_df.columns, rotation=45, ha='right', fontsize=10)
+        ax.set_yticks(np.arange(heatmap_values.shape[0]))
+        ax.set_yticklabels(pivot_df.index, fontsize=10)
+        ax.set_xlabel('Scenario')
+        ax.set_ylabel('Metric')
+        _set_margins(fig, left=0.16, right=1.0, top=0.94, bottom=0.3)
+        _fast_savefig(fig, heatmap_path)
+        plt.close(fig)
+        store_cached_chart(heatmap_cache, heatmap_path)
+
+    # Create a grouped bar chart comparing Multipath-NADA vs Aggregated-NADA across scenarios for key metrics.
+    # One figure is allocated up front and cleared for each metric instead of re-created.
+    # SIGNIFICANTLY increased figure size and spacing for better text label visibility
+    fig, ax = plt.subplots(figsize=(28, 12))  # Increased from (20, 10)
+    # Split the summary by metric in one grouped pass instead of a full scan per metric
+    metric_frames = dict(iter(summary_df.groupby('Metric', observed=True)))
     for metric in ['Throughput (Mbps)', 'Delay (seconds)', 'Loss (%)', 'Estimated MOS (1-5)',
                    'Buffer Length (ms)', 'Buffer Underruns', 'Delivery Efficiency (%)']:
-        metric_data = summary_df[summary_df['Metric'] == metric]
+        metric_data = metric_frames.get(metric)
 
-        if metric_data.empty:
+        if metric_data is None:
             print(f"No data for metric: {metric}")
             continue
 
-        # SIGNIFICANTLY increased figure size and spacing for better text label visibility
-        fig, ax = plt.subplots(figsize=(28, 12))  # Increased from (20, 10)
+        metric_name = metric.split('(')[0].strip().lower().replace(' ', '_')
+        metric_path = f"{summary_folder}/{metric_name}_comparison_{timestamp}.png"
+        metric_cache = chart_cache_path(metric, tuple(metric_data['Scenario'].astype(str)),
+                                        metric_data[['Multipath-NADA', 'Aggregated-NADA']].to_numpy())
+        if restore_cached_chart(metric_cache, metric_path):
+            continue
+
+        ax.clear()
 
         # Calculate the positions of the bars with MUCH MORE spacing
         scenarios = metric_data['Scenario'].unique()
@@ -1050,23 +1327,13 @@ def generate_summary_visualizations(all_results):
         ax.legend(fontsize=12)  # Increased font size
         ax.grid(axis='y', alpha=0.3)
 
-        # Add value labels on each bar with MUCH better positioning
-        def autolabel(rects):
-            for rect in rects:
-                height = rect.get_height()
-                if not np.isnan(height):
-                    # SIGNIFICANTLY increased vertical offset and improved formatting
-                    ax.annotate(f'{height:.2f}',
-                                xy=(rect.get_x() + rect.get_width() / 2, height),
-                                xytext=(0, 20),  # Increased from 10 to 20 for more space
-                                textcoords="offset points",
-                                ha='center', va='bottom',
-                                fontsize=10,  # Increased font size
-                                fontweight='bold',
-                                bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, edgecolor='gray'))
-
-        autolabel(rects1)
-        autolabel(rects2)
+        # Add value labels on each bar with MUCH better positioning (NaN bars stay unlabeled)
+        for rects in (rects1, rects2):
+            ax.bar_label(rects, fmt='%.2f',
+                         padding=20,  # Increased from 10 to 20 for more space
+                         fontsize=10,  # Increased font size
+                         fontweight='bold',
+                         bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, edgecolor='gray'))
 
         # Adjust y-axis limits to accommodate the higher text labels
         y_min, y_max = ax.get_ylim()
@@ -1074,77 +1341,84 @@ def generate_summary_visualizations(all_results):
         ax.set_ylim(y_min, y_max + 0.3 * y_range)  # Increased from 0.2 to 0.3 for more space
 
         # Adjust layout and save with higher DPI
-        fig.tight_layout()
-        metric_name = metric.split('(')[0].strip().lower().replace(' ', '_')
-        plt.savefig(f"{summary_folder}/{metric_name}_comparison_{timestamp}.png",
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+        _set_margins(fig, left=0.12, bottom=0.3)
+        _fast_savefig(fig, metric_path)
+        store_cached_chart(metric_cache, metric_path)
+
+    # Average improvement across all metrics by scenario - HORIZONTAL BAR CHART with better spacing.
+    # Per-scenario NaN-skipping mean from the heatmap's scenario codes via bincount
+    valid = ~np.isnan(improvement)
+    improvement_sums = np.bincount(scenario_codes[valid], weights=improvement[valid],
+                                   minlength=len(scenario_names_sorted))
+    improvement_counts = np.bincount(scenario_codes[valid], minlength=len(scenario_names_sorted))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scenario_means = (improvement_sums / improvement_counts)[observed]
+    order = np.argsort(scenario_means, kind='stable')
+    avg_improvement = pd.Series(scenario_means[order],
+                                index=pd.Index(scenario_names_sorted[observed][order], name='Scenario'))
+
+    average_path = f"{summary_folder}/average_improvement_by_scenario_{timestamp}.png"
+    average_cache = chart_cache_path('average', tuple(avg_improvement.index), avg_improvement.to_numpy())
+    if not restore_cached_chart(average_cache, average_path):
+        # Reuse the metric figure, resized, rather than opening another one
+        fig.clear()
+        fig.set_size_inches(16, 14)  # Increased height even more
+        ax = fig.add_subplot()
+
+        # Create horizontal bar chart for better label readability with MORE spacing
+        avg_improvement.plot(kind='barh', color='green', alpha=0.7, ax=ax)
+        ax.axvline(x=0, color='r', linestyle='-', alpha=0.7)
+        ax.set_title('Average Improvement (%) by Scenario', fontsize=18, pad=25, fontweight='bold')  # Increased sizes
+        ax.set_xlabel('Average Improvement (%)', fontsize=14)
+        ax.set_ylabel('Scenario', fontsize=14)
+
+        # Improve tick labels with larger fonts
+        ax.tick_params(axis='both', labelsize=12)
+        ax.grid(axis='x', alpha=0.3)
+
+        # Add value labels with MUCH better positioning for horizontal bars
+        for i, v in enumerate(avg_improvement):
+            if not np.isnan(v):
+                # SIGNIFICANTLY increased spacing and better formatting
+                offset = max(abs(v) * 0.08, 3)  # Increased from 0.05 and 2
+                text_x = v + offset if v >= 0 else v - offset
+                ax.text(text_x, i, f"{v:.1f}%", va='center',
+                        ha='left' if v >= 0 else 'right',
+                        fontsize=12,  # Increased font size
+                        fontweight='bold',
+                        bbox=dict(boxstyle='round,pad=0.4', facecolor='white', alpha=0.9, edgecolor='gray'))
+
+        # Adjust x-axis limits to accommodate the text labels with MORE space
+        x_min, x_max = ax.get_xlim()
+        x_range = x_max - x_min
+        ax.set_xlim(x_min - 0.4 * x_range, x_max + 0.4 * x_range)  # Increased from 0.25 to 0.4
+
+        _set_margins(fig, left=0.36, bottom=0.06)
+        _fast_savefig(fig, average_path)
+        store_cached_chart(average_cache, average_path)
+    plt.close(fig)
+
 
-    # Average improvement across all metrics by scenario - HORIZONTAL BAR CHART with better spacing
-    plt.figure(figsize=(16, 14))  # Increased height even more
-    avg_improvement = summary_df.groupby('Scenario')['Improvement (%)'].mean().sort_values()
-
-    # Create horizontal bar chart for better label readability with MORE spacing
-    bars = avg_improvement.plot(kind='barh', color='green', figsize=(16, 14), alpha=0.7)
-    plt.axvline(x=0, color='r', linestyle='-', alpha=0.7)
-    plt.title('Average Improvement (%) by Scenario', fontsize=18, pad=25, fontweight='bold')  # Increased sizes
-    plt.xlabel('Average Improvement (%)', fontsize=14)
-    plt.ylabel('Scenario', fontsize=14)
-
-    # Improve tick labels with larger fonts
-    plt.yticks(fontsize=12)
-    plt.xticks(fontsize=12)
-    plt.grid(axis='x', alpha=0.3)
-
-    # Add value labels with MUCH better positioning for horizontal bars
-    for i, v in enumerate(avg_improvement):
-        if not np.isnan(v):
-            # SIGNIFICANTLY increased spacing and better formatting
-            offset = max(abs(v) * 0.08, 3)  # Increased from 0.05 and 2
-            text_x = v + offset if v >= 0 else v - offset
-            plt.text(text_x, i, f"{v:.1f}%", va='center',
-                    ha='left' if v >= 0 else 'right',
-                    fontsize=12,  # Increased font size
-                    fontweight='bold',
-                    bbox=dict(boxstyle='round,pad=0.4', facecolor='white', alpha=0.9, edgecolor='gray'))
-
-    # Adjust x-axis limits to accommodate the text labels with MORE space
-    x_min, x_max = plt.xlim()
-    x_range = x_max - x_min
-    plt.xlim(x_min - 0.4 * x_range, x_max + 0.4 * x_range)  # Increased from 0.25 to 0.4
-
-    plt.tight_layout()
-    plt.savefig(f"{summary_folder}/average_improvement_by_scenario_{timestamp}.png",
-               dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
-
-
-def generate_strategy_comparison_visualizations(strategy_comparison_results):
+def generate_strategy_comparison_visualizations(strategy_comparison_results, timestamp):
     """Generate visualizations comparing different strategies for each base scenario."""
     strategy_folder = os.path.join(OUTPUT_DIR, "strategy_comparisons")
     os.makedirs(strategy_folder, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
     for base_scenario, strategies in strategy_comparison_results.items():
         print(f"Generating strategy comparison for: {base_scenario}")
 
-        # Create dataframe comparing all strategies for this base scenario
-        strategy_data = []
-        for strategy_name, (comparison_df, _) in strategies.items():
-            for _, row in comparison_df.iterrows():
-                strategy_data.append({
-                    'Strategy': strategy_name,
-                    'Metric': row['Metric'],
-                    'Multipath-NADA': row['Multipath-NADA'],
-                    'Aggregated-NADA': row['Aggregated-NADA'],
-                    'Improvement (%)': row['Improvement (%)']
-                })
-
-        if not strategy_data:
+        # Create dataframe comparing all strategies for this base scenario with one concat
+        # of the strategies' comparison frames (skipping runs that produced no rows)
+        strategy_frames = {strategy_name: comparison_df
+                           for strategy_name, (comparison_df, _) in strategies.items()
+                           if not comparison_df.empty}
+
+        if not strategy_frames:
             continue
 
-        strategy_df = pd.DataFrame(strategy_data)
+        strategy_df = pd.concat(strategy_frames.values(), ignore_index=True)
+        strategy_df.insert(0, 'Strategy', np.repeat(list(strategy_frames),
+                                                    [len(df) for df in strategy_frames.values()]))
 
         # Save strategy comparison data
         clean_base_name = base_scenario.lower().replace(' ', '_').replace('/', '_').replace('+', 'plus').replace('(', '').replace(')', '')
@@ -1153,7 +1427,9 @@ def generate_strategy_comparison_visualizations(strategy_comparison_results):
 
         # Save strategy comparison data
         strategy_csv_path = os.path.join(scenario_strategy_folder, f"{clean_base_name}_strategies_{timestamp}.csv")
-        strategy_df.to_csv(strategy_csv_path, index=False)
+        write_csv(strategy_df, strategy_csv_path)
+        if not GENERATE_PLOTS:
+            continue
 
         # Create visualizations for key metrics
         key_metrics = ['Throughput (Mbps)', 'Delay (seconds)', 'Loss (%)', 'Estimated MOS (1-5)']
@@ -1163,8 +1439,6 @@ def generate_strategy_comparison_visualizations(strategy_comparison_results):
             if metric_data.empty:
                 continue
 
-            plt.figure(figsize=(12, 8))
-
             # Create grouped bar chart
             strategies_list = metric_data['Strategy'].unique()
             x = np.arange(len(strategies_list))
@@ -1173,7 +1447,7 @@ def generate_strategy_comparison_visualizations(strategy_comparison_results):
             multipath_values = metric_data['Multipath-NADA'].values
             simple_values = metric_data['Aggregated-NADA'].values
 
-            fig, ax = plt.subplots(figsize=(12, 8))
+            fig, (ax,) = reuse_figure(1, 1, (12, 8))
             rects1 = ax.bar(x - width/2, multipath_values, width, label='Multipath-NADA')
             rects2 = ax.bar(x + width/2, simple_values, width, label='Aggregated-NADA')
 
@@ -1185,97 +1459,123 @@ def generate_strategy_comparison_visualizations(strategy_comparison_results):
             ax.legend()
 
             # Add value labels
-            for rect in rects1:
-                height = rect.get_height()
-                ax.annotate(f'{height:.2f}',
-                           xy=(rect.get_x() + rect.get_width() / 2, height),
-                           xytext=(0, 3),
-                           textcoords="offset points",
-                           ha='center', va='bottom')
-
-            for rect in rects2:
-                height = rect.get_height()
-                ax.annotate(f'{height:.2f}',
-                           xy=(rect.get_x() + rect.get_width() / 2, height),
-                           xytext=(0, 3),
-                           textcoords="offset points",
-                           ha='center', va='bottom')
-
-            plt.tight_layout()
-            metric_clean = metric.split('(')[0].strip().lower().replace(' ', '_')
-            plt.savefig(f"{strategy_folder}/{clean_base_name}_{metric_clean}_strategies_{timestamp}.png")
-            plt.close()
+            ax.bar_label(rects1, fmt='%.2f', padding=3)
+            ax.bar_label(rects2, fmt='%.2f', padding=3)
 
-            plt.close('all')
-            matplotlib.rcParams['figure.max_open_warning'] = 50
+            fig.tight_layout()
+            metric_clean = metric.split('(')[0].strip().lower().replace(' ', '_')
+            fig.savefig(f"{strategy_folder}/{clean_base_name}_{metric_clean}_strategies_{timestamp}.png")
 
         # Create improvement comparison chart
-        plt.figure(figsize=(12, 8))
+        fig, (ax,) = reuse_figure(1, 1, (12, 8))
         improvement_data = strategy_df.groupby('Strategy')['Improvement (%)'].mean().sort_values()
 
-        bars = improvement_data.plot(kind='bar', color='green')
-        plt.axhline(y=0, color='r', linestyle='-')
-        plt.title(f'Average Improvement (%) by Strategy - {base_scenario}')
-        plt.ylabel('Average Improvement (%)')
-        plt.xlabel('Path Selection Strategy')
-        plt.xticks(rotation=45, ha='right')
-        plt.grid(axis='y')
+        improvement_data.plot(kind='bar', color='green', ax=ax)
+        ax.axhline(y=0, color='r', linestyle='-')
+        ax.set_title(f'Average Improvement (%) by Strategy - {base_scenario}')
+        ax.set_ylabel('Average Improvement (%)')
+        ax.set_xlabel('Path Selection Strategy')
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        ax.grid(axis='y')
 
         # Add value labels
         for i, v in enumerate(improvement_data):
             if not np.isnan(v):
-                plt.text(i, v + (1 if v >= 0 else -1), f"{v:.1f}%", ha='center', va='bottom' if v >= 0 else 'top')
+                ax.text(i, v + (1 if v >= 0 else -1), f"{v:.1f}%", ha='center', va='bottom' if v >= 0 else 'top')
 
-        plt.tight_layout()
-        plt.savefig(f"{strategy_folder}/{clean_base_name}_strategy_improvements_{timestamp}.png")
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f"{strategy_folder}/{clean_base_name}_strategy_improvements_{timestamp}.png")
 
 # Function to save raw simulation data
-def save_raw_data(scenario_name, multipath_output, simple_output):
-    """Save raw simulation output for reference"""
+def raw_output_paths(scenario_name, timestamp):
+    """Return the raw output files for a scenario's multipath and simple simulations"""
     scenario_folder = get_scenario_folder(scenario_name)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    if multipath_output:
-        with open(f"{scenario_folder}/tcp_multipath_raw_output_{timestamp}.txt", 'w') as f:
-            f.write(multipath_output)
+    return (f"{scenario_folder}/tcp_multipath_raw_output_{timestamp}.txt",
+            f"{scenario_folder}/tcp_simple_raw_output_{timestamp}.txt")
+
+def write_csv(df, path):
+    """Write df to a CSV file, using pyarrow's C writer when it is installed"""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        # pyarrow is optional, fall back to the pandas writer
+        df.to_csv(path, index=False)
+        return
+
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+def append_summary_dataset(scenario_name, comparison_df):
+    """Write a scenario's comparison rows to its partition of the Parquet summary dataset"""
+    if comparison_df.empty:
+        return
+
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError:
+        # pyarrow is optional, the combined CSV written by main() has the same rows
+        return
 
-    if simple_output:
-        with open(f"{scenario_folder}/tcp_simple_raw_output_{timestamp}.txt", 'w') as f:
-            f.write(simple_output)
+    try:
+        table = pa.Table.from_pandas(comparison_df.assign(Scenario=scenario_name), preserve_index=False)
+        ds.write_dataset(
+            table, SUMMARY_DATASET_DIR, format='parquet',
+            partitioning=['Scenario'], partitioning_flavor='hive',
+            existing_data_behavior='delete_matching'  # Replace results from earlier runs
+        )
+    except Exception as e:
+        print(f"❌ Error writing summary dataset for {scenario_name}: {e}")
+
+def _can_create_file(path):
+    try:
+        with tempfile.TemporaryFile(dir=path):
+            return True
+    except OSError:
+        return False
+
+# Directories that already passed check_directory_permissions()
+_checked_directories = set()
 
 def check_directory_permissions(path):
-    """Check if directory is readable and writable"""
+    """Check if directory is readable and writable; a passing path is not re-checked"""
+    if path in _checked_directories:
+        return True
+
     print(f"Checking permissions for: {path}")
 
     try:
         # Check if directory exists
-        if not os.path.exists(path):
+        if not os.path.isdir(path):
             print(f"Directory doesn't exist, creating: {path}")
             os.makedirs(path, exist_ok=True)
 
-        # Check if we can list files
-        os.listdir(path)
-
-        # Check if we can write
-        test_file = os.path.join(path, "permission_test.tmp")
-        with open(test_file, 'w') as f:
-            f.write("Test")
-
-        # Check if we can read
-        with open(test_file, 'r') as f:
-            content = f.read()
-
-        # Clean up
-        os.remove(test_file)
+        # Check if we can list, read and write files. os.access only reads the mode
+        # bits; ACLs or network filesystems can make it say no wrongly, so only then
+        # fall back to creating a real (self-deleting) probe file
+        if not os.access(path, os.R_OK | os.W_OK | os.X_OK) and not _can_create_file(path):
+            print(f"❌ Permission error on {path}: not readable and writable")
+            return False
 
         print(f"✅ Directory {path} is readable and writable")
+        _checked_directories.add(path)
         return True
     except Exception as e:
         print(f"❌ Permission error on {path}: {e}")
         return False
 
 
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """One base scenario run with one path selection strategy."""
+    name: str
+    base_scenario: str
+    strategy: str
+    params: MappingProxyType
+    multipath_argv: tuple
+    simple_argv: tuple
+
 def generate_combined_scenarios():
     """Generate all combinations of base scenarios with path selection strategies"""
     combined_scenarios = []
@@ -1284,43 +1584,55 @@ def generate_combined_scenarios():
         for strategy in PATH_SELECTION_STRATEGIES:
             # Create a new scenario combining base scenario with strategy
             combined_name = f"{base_scenario['name']} - {strategy['name']}"
-            combined_params = base_scenario['params'].copy()
+            combined_params = {**SCENARIO_DEFAULTS, **base_scenario['params']}
             combined_params['pathSelectionStrategy'] = strategy['strategy']
 
             if strategy['name'] == "Frame Type Aware":
                 combined_params['keyFrameInterval'] = 30
 
-            combined_scenarios.append({
-                "name": combined_name,
-                "base_scenario": base_scenario['name'],
-                "strategy": strategy['name'],
-                "params": combined_params
-            })
+            multipath_argv = build_argv("scratch/strategy-mp", combined_params)
+
+            # Aggregated-NADA-nada runs with the same parameters (excluding strategy)
+            simple_params = combined_params.copy()
+            simple_params.pop('pathSelectionStrategy', None)  # Remove strategy for simple TCP
 
-    return combined_scenarios
+            combined_scenarios.append(Scenario(
+                name=combined_name,
+                base_scenario=base_scenario['name'],
+                strategy=strategy['name'],
+                params=MappingProxyType(combined_params),
+                multipath_argv=multipath_argv,
+                simple_argv=build_argv("scratch/simple-nada", simple_params)
+            ))
 
+    return tuple(combined_scenarios)
+
+@lru_cache(maxsize=None)
 def get_scenario_folder(scenario_name):
-    """Create and return path to scenario-specific folder"""
+    """Create and return path to scenario-specific folder (created once per run)"""
     # Replace problematic characters and create a clean folder name
     folder_name = scenario_name.lower().replace(' ', '_').replace('-', '_').replace('(', '').replace(')', '')
     folder_path = os.path.join(OUTPUT_DIR, folder_name)
     os.makedirs(folder_path, exist_ok=True)
     return folder_path
 
-def generate_strategy_focused_summary_visualizations(all_results):
+def generate_strategy_focused_summary_visualizations(all_results, timestamp):
     """Generate summary visualizations with separate subcharts for each strategy."""
+    # This pass only draws charts
+    if not GENERATE_PLOTS:
+        return
+
     # Create summary folder
     summary_folder = os.path.join(OUTPUT_DIR, "summary")
     os.makedirs(summary_folder, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
     # Set matplotlib to handle memory better
-    import matplotlib
     matplotlib.rcParams['figure.max_open_warning'] = 100
 
-    # Organize data by strategy
+    # Organize data by strategy; each scenario's values are also indexed by metric
+    # once, so the per-metric charts look them up instead of re-filtering frames
     strategy_data = {}
+    strategy_metric_values = {}
 
     for scenario_name, (comparison_df, _) in all_results.items():
         # Check if comparison_df is empty or doesn't have the required columns
@@ -1337,9 +1649,15 @@ def generate_strategy_focused_summary_visualizations(all_results):
 
         if strategy not in strategy_data:
             strategy_data[strategy] = {}
+            strategy_metric_values[strategy] = {}
 
         if base_scenario not in strategy_data[strategy]:
             strategy_data[strategy][base_scenario] = comparison_df
+            metric_values = strategy_metric_values[strategy][base_scenario] = {}
+            for metric, multipath_value, simple_value in zip(comparison_df['Metric'],
+                                                             comparison_df['Multipath-NADA'],
+                                                             comparison_df['Aggregated-NADA']):
+                metric_values.setdefault(metric, (multipath_value, simple_value))
 
     # Check if we have any valid data
     if not strategy_data:
@@ -1348,19 +1666,25 @@ def generate_strategy_focused_summary_visualizations(all_results):
 
     # Create visualizations for key metrics with better spacing
     key_metrics = ['Throughput (Mbps)', 'Delay (seconds)', 'Loss (%)', 'Estimated MOS (1-5)']
+    strategy_names = list(strategy_data.keys())
+
+    # Create a figure with subplots for each strategy - increased size. It is
+    # cleared and reused for every metric and for the improvement comparison
+    fig, axes = plt.subplots(2, 3, figsize=(24, 16))  # Increased from (20, 12)
+    axes_flat = axes.flatten()
+
+    def reset_figure():
+        for ax in axes_flat:
+            ax.clear()
+            ax.set_visible(True)
 
     for metric in key_metrics:
         print(f"Processing metric: {metric}")
 
-        # Create a figure with subplots for each strategy - increased size
-        fig, axes = plt.subplots(2, 3, figsize=(24, 16))  # Increased from (20, 12)
+        reset_figure()
         fig.suptitle(f'{metric} Comparison: Multipath vs Single Path by Strategy',
                     fontsize=18, fontweight='bold', y=0.98)
 
-        # Flatten axes for easier iteration
-        axes_flat = axes.flatten()
-        strategy_names = list(strategy_data.keys())
-
         for idx, strategy in enumerate(strategy_names):
             if idx >= len(axes_flat):
                 break
@@ -1372,16 +1696,12 @@ def generate_strategy_focused_summary_visualizations(all_results):
             multipath_values = []
             simple_values = []
 
-            for base_scenario, comparison_df in strategy_data[strategy].items():
-                # Additional check for DataFrame validity
-                if comparison_df.empty or 'Metric' not in comparison_df.columns:
-                    continue
-
-                metric_row = comparison_df[comparison_df['Metric'] == metric]
-                if not metric_row.empty:
+            for base_scenario, metric_values in strategy_metric_values[strategy].items():
+                if metric in metric_values:
                     base_scenarios.append(base_scenario)
-                    multipath_values.append(metric_row['Multipath-NADA'].iloc[0])
-                    simple_values.append(metric_row['Aggregated-NADA'].iloc[0])
+                    multipath_value, simple_value = metric_values[metric]
+                    multipath_values.append(multipath_value)
+                    simple_values.append(simple_value)
 
             if base_scenarios:
                 # Increase spacing between bars
@@ -1405,19 +1725,11 @@ def generate_strategy_focused_summary_visualizations(all_results):
                 ax.legend(fontsize=10, loc='upper right')
                 ax.grid(axis='y', alpha=0.3)
 
-                # Add value labels on bars with better positioning
-                def add_value_labels(bars):
-                    for bar in bars:
-                        height = bar.get_height()
-                        if not np.isnan(height):
-                            ax.annotate(f'{height:.2f}',
-                                       xy=(bar.get_x() + bar.get_width() / 2, height),
-                                       xytext=(0, 8),  # Increased offset
-                                       textcoords="offset points",
-                                       ha='center', va='bottom', fontsize=8, fontweight='bold')
-
-                add_value_labels(bars1)
-                add_value_labels(bars2)
+                # Add value labels on bars with better positioning (none for missing values)
+                for bars, values in ((bars1, multipath_values), (bars2, simple_values)):
+                    values = np.asarray(values, dtype=np.float64)
+                    ax.bar_label(bars, labels=np.where(np.isnan(values), '', np.char.mod('%.2f', values)),
+                                 padding=8, fontsize=8, fontweight='bold')
 
                 # Adjust y-limits for text spacing
                 y_min, y_max = ax.get_ylim()
@@ -1433,21 +1745,18 @@ def generate_strategy_focused_summary_visualizations(all_results):
         for idx in range(len(strategy_names), len(axes_flat)):
             axes_flat[idx].set_visible(False)
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])  # Adjust for suptitle
+        # Leaves room for the suptitle and the rotated scenario names under both rows
+        _set_margins(fig, left=0.045, right=0.99, top=0.9, bottom=0.17, wspace=0.23, hspace=0.57)
         metric_clean = metric.split('(')[0].strip().lower().replace(' ', '_')
-        plt.savefig(f"{summary_folder}/strategy_comparison_{metric_clean}_{timestamp}.png",
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+        _fast_savefig(fig, f"{summary_folder}/strategy_comparison_{metric_clean}_{timestamp}.png")
         print(f"Saved strategy comparison for {metric}")
 
     # Create improvement percentage comparison by strategy with better spacing
     print("Creating improvement percentage comparison...")
-    fig, axes = plt.subplots(2, 3, figsize=(24, 16))  # Increased size
+    reset_figure()
     fig.suptitle('Average Improvement (%) by Strategy Across All Metrics',
                 fontsize=18, fontweight='bold', y=0.98)
 
-    axes_flat = axes.flatten()
-
     for idx, strategy in enumerate(strategy_names):
         if idx >= len(axes_flat):
             break
@@ -1504,15 +1813,15 @@ def generate_strategy_focused_summary_visualizations(all_results):
     for idx in range(len(strategy_names), len(axes_flat)):
         axes_flat[idx].set_visible(False)
 
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-    plt.savefig(f"{summary_folder}/strategy_improvements_comparison_{timestamp}.png",
-               dpi=300, bbox_inches='tight', facecolor='white')
+    # Scenario names sit left of each horizontal bar chart, so the columns need wide gaps
+    _set_margins(fig, left=0.11, right=0.98, top=0.9, bottom=0.07, wspace=0.59, hspace=0.16)
+    _fast_savefig(fig, f"{summary_folder}/strategy_improvements_comparison_{timestamp}.png")
     plt.close(fig)
     print("Saved strategy improvements comparison")
 
     # Create a comprehensive strategy ranking chart with better spacing
     print("Creating comprehensive strategy ranking...")
-    plt.figure(figsize=(16, 10))
+    fig = plt.figure(figsize=(16, 10))
 
     # Calculate overall performance for each strategy
     strategy_performance = {}
@@ -1579,134 +1888,214 @@ def generate_strategy_focused_summary_visualizations(all_results):
         y_range = y_max - y_min
         plt.ylim(y_min - 0.1 * y_range, y_max + 0.15 * y_range)
 
-        plt.tight_layout()
-        plt.savefig(f"{summary_folder}/overall_strategy_ranking_{timestamp}.png",
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
+        _set_margins(fig, left=0.05, right=0.99, top=0.91, bottom=0.18)
+        _fast_savefig(fig, f"{summary_folder}/overall_strategy_ranking_{timestamp}.png")
+        plt.close(fig)
         print("Saved overall strategy ranking")
     else:
         print("Warning: No valid strategy performance data for ranking chart")
-        plt.close()
+        plt.close(fig)
+
+
+def process_scenario_results(scenario_name, multipath_stats, simple_stats, timestamp):
+    """Analyze, persist and plot one scenario's results; runs in a worker process."""
+    # Analyze results
+    comparison_df, path_data = analyze_results(multipath_stats, simple_stats)
+
+    # Persist this scenario's rows as soon as they are available
+    append_summary_dataset(scenario_name, comparison_df)
+
+    # Generate scenario-specific visualizations
+    if GENERATE_PLOTS:
+        generate_visualizations(comparison_df, path_data, scenario_name, timestamp)
+
+    return comparison_df, path_data
 
+async def run_scenario(i, scenario, semaphore, executor, timestamp):
+    """Run both simulations of a scenario, then parse, analyze and plot the results."""
+    scenario_name = scenario.name
+
+    print(f"\n[{i}/{len(SIMULATION_SCENARIOS)}] " + "=" * 50)
+    print(f"Processing scenario: {scenario_name}")
+    print(f"Base scenario: {scenario.base_scenario}")
+    print(f"Strategy: {scenario.strategy}")
+    print("=" * 50)
+
+    # Run Multipath-NADA-nada and Aggregated-NADA-nada simulations concurrently;
+    # each output is parsed while its simulation runs and saved as raw output
+    multipath_raw_path, simple_raw_path = raw_output_paths(scenario_name, timestamp)
+    multipath_stats, simple_stats = await asyncio.gather(
+        run_simulation(scenario.multipath_argv, multipath_raw_path, scenario.params, semaphore),
+        run_simulation(scenario.simple_argv, simple_raw_path, scenario.params, semaphore)
+    )
+
+    # Only compare when both simulations produced output
+    if not (multipath_stats and simple_stats):
+        multipath_stats, simple_stats = {}, {}
+
+    # Analysis and plotting are CPU-bound, so hand them to the process pool and keep
+    # the event loop free to stream output from the simulations still running
+    loop = asyncio.get_running_loop()
+    comparison_df, path_data = await loop.run_in_executor(
+        executor, process_scenario_results, scenario_name, multipath_stats, simple_stats, timestamp)
+
+    print(f"✅ Completed processing scenario: {scenario_name}")
+    return comparison_df, path_data
+
+async def run_all_scenarios(timestamp):
+    """Run every scenario concurrently, bounded by MAX_PARALLEL_SIMULATIONS running simulations."""
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_SIMULATIONS)
+    # spawn rather than fork: the event loop and its child watcher are running by now
+    with ProcessPoolExecutor(max_workers=MAX_PARALLEL_SIMULATIONS,
+                             mp_context=multiprocessing.get_context('spawn'),
+                             initializer=init_worker, initargs=(GENERATE_PLOTS,)) as executor:
+        return await asyncio.gather(*(
+            run_scenario(i, scenario, semaphore, executor, timestamp)
+            for i, scenario in enumerate(SIMULATION_SCENARIOS, 1)
+        ))
 
 def main():
+    global USE_SIMULATION_CACHE
+
     print("=" * 80)
     print(f"Starting TCP NADA comparison with output to: {os.path.abspath(OUTPUT_DIR)}")
     print(f"Total scenarios to process: {len(SIMULATION_SCENARIOS)}")
+    print(f"Running up to {MAX_PARALLEL_SIMULATIONS} simulations in parallel")
     print("=" * 80)
 
+    if not build_simulations():
+        sys.exit(1)
+
+    # Without the model sources a cached result cannot be told apart from a stale one
+    if USE_SIMULATION_CACHE and model_sources_digest() is None:
+        print(f"⚠️ {MODEL_SOURCE_DIR} not found, so cached simulations cannot be checked "
+              f"against the model sources; running every simulation")
+        USE_SIMULATION_CACHE = False
+
+    # One timestamp names every file written by this run, including those written
+    # by the plotting workers
+    run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
     # Store all results for summary visualization
     all_results = {}
     strategy_comparison_results = {}
 
     # Run all scenarios
-    for i, scenario in enumerate(SIMULATION_SCENARIOS, 1):
-        scenario_name = scenario["name"]
-        base_scenario = scenario["base_scenario"]
-        strategy = scenario["strategy"]
+    scenario_results = asyncio.run(run_all_scenarios(run_timestamp))
 
-        print(f"\n[{i}/{len(SIMULATION_SCENARIOS)}] " + "=" * 50)
-        print(f"Processing scenario: {scenario_name}")
-        print(f"Base scenario: {base_scenario}")
-        print(f"Strategy: {strategy}")
-        print("=" * 50)
-
-        # Run Multipath-NADA-nada simulation
-        multipath_output = run_simulation("scratch/strategy-mp", scenario["params"])
-
-        # Run Aggregated-NADA-nada simulation with same parameters (excluding strategy)
-        simple_params = scenario["params"].copy()
-        simple_params.pop('pathSelectionStrategy', None)  # Remove strategy for simple TCP
-        simple_output = run_simulation("scratch/simple-nada", simple_params)
-
-        # Save raw outputs
-        save_raw_data(scenario_name, multipath_output, simple_output)
-
-        # Parse outputs
-        multipath_stats, simple_stats = {}, {}
-        if multipath_output and simple_output:
-            multipath_stats = parse_output(multipath_output)
-            simple_stats = parse_output(simple_output)
-
-        # Analyze results
-        comparison_df, path_df = analyze_results(multipath_stats, simple_stats)
+    # Collect in scenario order so summaries do not depend on completion order
+    for scenario, (comparison_df, path_data) in zip(SIMULATION_SCENARIOS, scenario_results):
+        scenario_name = scenario.name
+        base_scenario = scenario.base_scenario
+        strategy = scenario.strategy
 
         # Store results for summary
-        all_results[scenario_name] = (comparison_df, path_df)
+        all_results[scenario_name] = (comparison_df, path_data)
 
         # Store results grouped by base scenario for strategy comparison
         if base_scenario not in strategy_comparison_results:
             strategy_comparison_results[base_scenario] = {}
-        strategy_comparison_results[base_scenario][strategy] = (comparison_df, path_df)
-
-        # Generate scenario-specific visualizations
-        generate_visualizations(comparison_df, path_df, scenario_name)
-
-        print(f"✅ Completed processing scenario: {scenario_name}")
-
-    # Generate summary visualizations across all scenarios
+        strategy_comparison_results[base_scenario][strategy] = (comparison_df, path_data)
+
+    # Generate summary, strategy-focused and strategy comparison visualizations.
+    # They only read the collected results, so they can render side by side in
+    # worker processes (Agg drawing holds the GIL, so threads would not help)
+    summary_jobs = [
+        (generate_summary_visualizations, all_results),
+        (generate_strategy_focused_summary_visualizations, all_results),
+        (generate_strategy_comparison_visualizations, strategy_comparison_results),
+    ]
     print("\n" + "=" * 50)
     print("Generating summary visualizations")
     print("=" * 50)
-    generate_summary_visualizations(all_results)
-
-    print("\n" + "=" * 50)
-    print("Generating strategy-focused summary visualizations")
-    print("=" * 50)
-    generate_strategy_focused_summary_visualizations(all_results)
-
-    # Generate strategy comparison visualizations
-    print("\n" + "=" * 50)
-    print("Generating strategy comparison visualizations")
-    print("=" * 50)
-    generate_strategy_comparison_visualizations(strategy_comparison_results)
+    if MAX_PARALLEL_SIMULATIONS > 1:
+        with ProcessPoolExecutor(max_workers=min(len(summary_jobs), MAX_PARALLEL_SIMULATIONS),
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=init_worker, initargs=(GENERATE_PLOTS,)) as executor:
+            futures = [executor.submit(job, results, run_timestamp) for job, results in summary_jobs]
+            for future in futures:
+                future.result()
+    else:
+        for job, results in summary_jobs:
+            job(results, run_timestamp)
 
     print("\n✅ All scenarios processed successfully")
 
-    # Create a unique timestamp for this run
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
     # Save a summary CSV with all results
-    summary_path = os.path.join(OUTPUT_DIR, f"all_scenarios_summary_{timestamp}.csv")
+    summary_path = os.path.join(OUTPUT_DIR, f"all_scenarios_summary_{run_timestamp}.csv")
     try:
-        # Create a combined DataFrame from all results
-        all_data = []
-        for scenario_name, (comparison_df, _) in all_results.items():
-            scenario_data = comparison_df.copy()
-            scenario_data['Scenario'] = scenario_name
-            all_data.append(scenario_data)
-
-        if all_data:
-            combined_df = pd.concat(all_data)
-            combined_df.to_csv(summary_path, index=False)
+        # Create a combined DataFrame from all results with one concat, adding the
+        # Scenario column afterwards instead of copying every frame first
+        frames = {scenario_name: comparison_df
+                  for scenario_name, (comparison_df, _) in all_results.items()
+                  if not comparison_df.empty}
+
+        if all_results:
+            combined_df = pd.concat(frames.values(), ignore_index=True) if frames else pd.DataFrame(
+                columns=['Metric', 'Multipath-NADA', 'Aggregated-NADA', 'Improvement (%)'])
+            combined_df['Scenario'] = np.repeat(list(frames), [len(df) for df in frames.values()])
+            write_csv(combined_df, summary_path)
             print(f"✅ Saved combined results to: {summary_path}")
     except Exception as e:
         print(f"❌ Error saving summary CSV: {e}")
 
+def positive_int(value):
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare multipath and single-path TCP NADA across ns-3 scenarios")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--fast', action='store_true',
+                      help='Shorten the simulations for quick comparative testing')
+    mode.add_argument('--quick', action='store_true',
+                      help='Like --fast, but only run a single base scenario')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore cached simulation results and run every simulation')
+    parser.add_argument('--jobs', type=positive_int, default=MAX_PARALLEL_SIMULATIONS,
+                        help=f'Number of ns-3 runs in parallel (default: {MAX_PARALLEL_SIMULATIONS})')
+    parser.add_argument('--no-plots', action='store_true',
+                        help='Only write the CSV/Parquet results, skip all charts')
+    args = parser.parse_args()
+
     print("\n" + "="*50)
     print("NS-3 TCP NADA MULTIPATH COMPARISON TOOL")
     print("="*50)
 
-    import sys
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--fast":
-            print("🚀 FAST MODE: Applying optimizations for quick comparative testing")
-            apply_fast_mode_optimizations()
-        elif sys.argv[1] == "--quick":
-            print("⚡ QUICK MODE: Using subset of scenarios")
-            # Use only first 5 scenarios for quick testing
-            BASE_SIMULATION_SCENARIOS = BASE_SIMULATION_SCENARIOS[1:2]
-            apply_fast_mode_optimizations()
+    prepare_output_dir()
+
+    if args.fast:
+        print("🚀 FAST MODE: Applying optimizations for quick comparative testing")
+        apply_fast_mode_optimizations()
+    elif args.quick:
+        print("⚡ QUICK MODE: Using subset of scenarios")
+        # Use only a single base scenario for quick testing
+        BASE_SIMULATION_SCENARIOS = BASE_SIMULATION_SCENARIOS[1:2]
+        apply_fast_mode_optimizations()
+
+    if args.no_cache:
+        print("🔄 Ignoring cached simulation results")
+        USE_SIMULATION_CACHE = False
+
+    # Cap concurrent ns-3 runs, e.g. to leave cores free on a shared machine
+    MAX_PARALLEL_SIMULATIONS = args.jobs
+
+    GENERATE_PLOTS = not args.no_plots
+    if GENERATE_PLOTS:
+        load_plotting()
 
     SIMULATION_SCENARIOS = generate_combined_scenarios()
 
     # Check libraries
-    import matplotlib
-    print(f"Matplotlib version: {matplotlib.__version__}")
+    if GENERATE_PLOTS:
+        print(f"Matplotlib version: {matplotlib.__version__}")
+    else:
+        print("📄 NO-PLOTS MODE: Writing result tables only")
     print(f"Pandas version: {pd.__version__}")
     print(f"NumPy version: {np.__version__}")
-    print(f"Seaborn version: {sns.__version__}")
 
     # Check output directories
     print("\nChecking directories:")
@@ -1714,7 +2103,7 @@ if __name__ == "__main__":
 
     # Check scenario directories (just check first few)
     for scenario in SIMULATION_SCENARIOS[:2]:
-        scenario_folder = get_scenario_folder(scenario["name"])
+        scenario_folder = get_scenario_folder(scenario.name)
         check_directory_permissions(scenario_folder)
 
     print(f"\nTotal scenarios to run: {len(SIMULATION_SCENARIOS)}")